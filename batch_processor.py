@@ -4,12 +4,13 @@ Manages queues, scheduling, and parallel execution.
 """
 
 import os
-from pathlib import Path
-from typing import List, Dict, Callable, Optional
+from typing import List, Dict, Optional, Deque
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
+from collections import deque
 import threading
+import uuid
 
 
 class TranslationEngineType(Enum):
@@ -33,7 +34,7 @@ class TranslationJob:
     """Single file translation job."""
     file_path: str
     engine: TranslationEngineType
-    job_id: str = field(default_factory=lambda: str(datetime.now().timestamp()))
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)  # Timestamps collide for files queued together
     status: TranslationStatus = TranslationStatus.PENDING
     progress: int = 0
     message: str = ""
@@ -59,6 +60,51 @@ class TranslationJob:
             "completed_at": self.completed_at
         }
 
+    def reset(self, file_path: str, engine: TranslationEngineType, config: Optional[Dict] = None):
+        """Reinitialize a pooled job for a new file, with a fresh job_id."""
+        self.file_path = file_path
+        self.engine = engine
+        self.job_id = uuid.uuid4().hex
+        self.status = TranslationStatus.PENDING
+        self.progress = 0
+        self.message = ""
+        self.output_path = None
+        self.config = config or {}
+        self.created_at = datetime.now().isoformat()
+        self.started_at = None
+        self.completed_at = None
+
+
+class JobPool:
+    """Free list of TranslationJob objects reused across batches."""
+
+    def __init__(self, max_free: int = 1024):
+        """
+        Initialize job pool.
+        
+        Args:
+            max_free: Maximum number of released jobs kept for reuse
+        """
+        self.free: Deque[TranslationJob] = deque(maxlen=max_free)
+        self.lock = threading.Lock()
+
+    def acquire(self, file_path: str, engine: TranslationEngineType,
+                config: Optional[Dict] = None) -> TranslationJob:
+        """Get a job for a file, reusing a released one when available."""
+        with self.lock:
+            job = self.free.pop() if self.free else None
+
+        if job is None:
+            return TranslationJob(file_path=file_path, engine=engine, config=config or {})
+        job.reset(file_path, engine, config)
+        return job
+
+    def release(self, job: TranslationJob):
+        """Return a finished job to the pool."""
+        job.config = {}  # Drop callbacks so the pool does not keep old processors alive
+        with self.lock:
+            self.free.append(job)
+
 
 class BatchTranslationQueue:
     """Manages a queue of translation jobs."""
@@ -3,14 +3,12 @@ Batch translation threads for parallel file processing.
 Extends single-file translation threads to work with batch queue.
 """
 
-import os
 import time
 from typing import Optional, Dict, Callable
-from PySide6.QtCore import QThread, Signal, QMutex, QWaitCondition
+from PySide6.QtCore import QThread, Signal, QMutex
 
 from batch_processor import (
-    BatchTranslationQueue, TranslationJob, TranslationEngineType,
-    TranslationStatus
+    BatchTranslationQueue, TranslationJob, TranslationEngineType
 )
 
 
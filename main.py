@@ -9,15 +9,21 @@ Date: 2026
 import sys
 import os
 import re
-import json
+import mmap
+import asyncio
+import threading
+import functools
+import time
 import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait as wait_futures
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Callable, Optional
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
     QFileDialog, QProgressBar, QComboBox, QLineEdit, QTextEdit, QListWidget,
-    QListWidgetItem, QSpinBox, QTabWidget
+    QListWidgetItem, QSpinBox, QTabWidget, QFrame, QListView
 )
 from PySide6.QtCore import QThread, Signal, Qt, QTimer
 from PySide6.QtGui import QFont, QColor
@@ -37,14 +43,24 @@ except ImportError:
 
 try:
     import openai
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
+    import httpx
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
 
+try:
+    import h2  # Enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Import batch processing modules
-from batch_processor import TranslationEngineType, TranslationStatus, TranslationJob
+from batch_processor import TranslationEngineType, TranslationStatus, TranslationJob, JobPool
 from simple_batch import SimpleBatchProcessor
+from rate_limiter import RateLimiter, RequestCancelled
+from subtitle_batcher import TokenCounter, SubtitleBatcher
+from translation_verifier import TranslationVerifier, parse_cues
 
 
 # ===================== UTILITIES =====================
@@ -72,6 +88,19 @@ class SRTParser:
 
         return subtitles
 
+    @staticmethod
+    def parse_file(file_path: str) -> List[Dict[str, str]]:
+        """
+        Parse an SRT file by scanning its memory-mapped bytes with one compiled regex.
+        Avoids materializing the whole file as a string; only matched fields are decoded.
+        Cues are built by the verifier's parse_cues, so both agree on cues and decoding.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []  # mmap cannot map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return parse_cues(mm)
+
     @staticmethod
     def format(subtitles: List[Dict[str, str]]) -> str:
         """Format subtitles back to SRT content."""
@@ -83,6 +112,28 @@ class SRTParser:
             output.append('')  # Empty line between blocks
         return '\n'.join(output).strip() + '\n'
 
+    @staticmethod
+    def arabic_output_path(srt_path: str) -> str:
+        """Return the Arabic output path next to an SRT file (input.srt -> input.ar.srt)."""
+        path = Path(srt_path)
+        return str(path.with_name(path.stem + ".ar.srt"))
+
+    @staticmethod
+    def write_file(file_path: str, subtitles: List[Dict[str, str]]):
+        """
+        Write subtitles to an SRT file atomically.
+        Content goes to a temp file first and is moved into place with os.replace,
+        so a crash or stop mid-write never leaves a truncated file behind.
+        """
+        tmp_path = file_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(SRTParser.format(subtitles))
+            os.replace(tmp_path, file_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
 
 class CodeDetector:
     """Detect and protect code snippets and technical terms."""
@@ -97,16 +148,145 @@ class CodeDetector:
         r"`[^`]+`",  # Code blocks
     ]
 
+    # All patterns joined into one alternation so each text is scanned once
+    _COMBINED = re.compile('|'.join(f'(?:{pattern})' for pattern in PATTERNS))
+
     @staticmethod
+    @functools.lru_cache(maxsize=4096)  # Subtitles repeat many short lines
     def is_code_or_technical(text: str) -> bool:
         """Check if text contains code or technical terms."""
-        if not text.strip():
+        if not text or text.isspace():
             return False
-        
-        for pattern in CodeDetector.PATTERNS:
-            if re.search(pattern, text):
-                return True
-        return False
+        return CodeDetector._COMBINED.search(text) is not None
+
+
+class ModelCache:
+    """Process-wide cache of loaded Whisper models and Argos translations."""
+
+    _lock = threading.Lock()  # Guards the dicts below; never held while loading
+    _key_locks: Dict[object, threading.Lock] = {}
+    _whisper_models: Dict[Tuple[str, str, str], object] = {}  # Only the most recently used model
+    _argos_translations: Dict[Tuple[str, str], object] = {}
+    _argos_index_lock = threading.Lock()
+    _argos_index_checked = False
+
+    @staticmethod
+    def _key_lock(key) -> threading.Lock:
+        """Lock serializing loads of one key, so different models load independently."""
+        with ModelCache._lock:
+            lock = ModelCache._key_locks.get(key)
+            if lock is None:
+                lock = ModelCache._key_locks[key] = threading.Lock()
+            return lock
+
+    @staticmethod
+    def whisper_model(name: str, device: str, compute_type: str):
+        """
+        Return a loaded Faster-Whisper model, loading it only on first use.
+        Only the most recently used model is kept, so switching sizes does not keep
+        every model resident; threads still using an older one keep their reference.
+        """
+        key = (name, device, compute_type)
+        with ModelCache._key_lock(("whisper",) + key):
+            with ModelCache._lock:
+                model = ModelCache._whisper_models.get(key)
+            if model is None:
+                model = WhisperModel(name, device=device, compute_type=compute_type)
+            with ModelCache._lock:
+                ModelCache._whisper_models = {key: model}
+            return model
+
+    @staticmethod
+    def ensure_argos_index():
+        """
+        Update the Argos package index once per process.
+        A failed update (e.g. offline) is not retried, so parallel jobs do not each
+        wait on the network in turn.
+        """
+        with ModelCache._argos_index_lock:
+            if ModelCache._argos_index_checked:
+                return
+            ModelCache._argos_index_checked = True
+            try:
+                package.update_package_index()
+            except Exception:
+                pass  # Ignore if this fails (e.g. offline)
+
+    @staticmethod
+    def argos_translation(from_code: str = "en", to_code: str = "ar"):
+        """
+        Return the installed Argos translation between two languages, or None.
+        translate.translate() looks this up again on every call; caching it avoids that.
+        """
+        key = (from_code, to_code)
+        with ModelCache._key_lock(("argos",) + key):
+            with ModelCache._lock:
+                translation = ModelCache._argos_translations.get(key)
+            if translation is None:
+                languages = {language.code: language for language in translate.get_installed_languages()}
+                if from_code not in languages or to_code not in languages:
+                    return None
+                translation = languages[from_code].get_translation(languages[to_code])
+                if translation is None:
+                    return None
+                with ModelCache._lock:
+                    ModelCache._argos_translations[key] = translation
+            return translation
+
+
+class TranslationCache:
+    """Thread-safe LRU cache of translations keyed by engine and normalized source text."""
+
+    def __init__(self, maxsize: int = 50000):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize source text so trivially different repeats share one entry."""
+        return text.strip().lower()
+
+    def get(self, engine: str, text: str) -> Optional[str]:
+        """Return the cached translation of text, or None."""
+        key = (engine, self.normalize(text))
+        with self._lock:
+            translation = self._data.get(key)
+            if translation is not None:
+                self._data.move_to_end(key)
+            return translation
+
+    def put(self, engine: str, text: str, translation: str):
+        """Store a translation, evicting the least recently used entry when full."""
+        key = (engine, self.normalize(text))
+        with self._lock:
+            self._data[key] = translation
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class AsyncRunner:
+    """Run coroutines on one long-lived event loop in a background thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def run(self, coro):
+        """Run a coroutine on the loop and block the calling thread until it finishes."""
+        if not self.loop.is_running():
+            coro.close()
+            raise RuntimeError("Async runner has been closed")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def close(self):
+        """Stop the loop and wait for its thread to exit."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+        if not self._thread.is_alive():
+            self.loop.close()
 
 
 class TranslationValidator:
@@ -237,7 +417,7 @@ class WhisperTranslateThread(QThread):
     
     status_update = Signal(str)
     progress_update = Signal(int)
-    translation_finished = Signal(str)
+    translation_finished = Signal(str, object)  # message, final cues (None unless a translated SRT was saved)
 
     def __init__(self, video_path: str, model: str = "medium", extract_only: bool = True, target_lang: str = "ar", api_key: str = "", engine: str = "openai", extraction_engine: str = "whisper"):
         super().__init__()
@@ -259,7 +439,7 @@ class WhisperTranslateThread(QThread):
             
             if self.extraction_engine == "whisper":
                 if not WHISPER_AVAILABLE:
-                    self.translation_finished.emit("Error: faster-whisper not installed. Run: pip install faster-whisper")
+                    self.translation_finished.emit("Error: faster-whisper not installed. Run: pip install faster-whisper", None)
                     return
 
                 self.status_update.emit(f"Loading Faster-Whisper model ({self.model_name})...")
@@ -267,9 +447,10 @@ class WhisperTranslateThread(QThread):
                 
                 import torch
                 device = "cuda" if torch.cuda.is_available() else "cpu"
-                compute_type = "float16" if device == "cuda" else "int8"
+                # int8 weights (CTranslate2) cut memory ~4x and speed up inference
+                compute_type = "int8_float16" if device == "cuda" else "int8"
                 
-                self.model = WhisperModel(self.model_name, device=device, compute_type=compute_type)
+                self.model = ModelCache.whisper_model(self.model_name, device, compute_type)
 
                 # Extract audio from video
                 self.status_update.emit("Extracting audio from video...")
@@ -282,19 +463,31 @@ class WhisperTranslateThread(QThread):
                 self.status_update.emit("Transcribing audio with Faster-Whisper (Offline)...")
                 self.progress_update.emit(40)
 
-                segments, info = self.model.transcribe(audio_path, beam_size=5)
+                segments, info = self.model.transcribe(audio_path, beam_size=1, vad_filter=True)
+                duration = getattr(info, 'duration', 0) or 0
+                progress_end = 85 if self.extract_only else 50
                 
-                # Convert to SRT format list
+                # Convert to SRT format list. segments is lazy: transcription runs while
+                # iterating, so report progress per segment instead of staying silent
                 for i, segment in enumerate(segments):
                     srt_segments.append({
                         'index': str(i + 1),
                         'timestamp': f"{self._seconds_to_srt_time(segment.start)} --> {self._seconds_to_srt_time(segment.end)}",
                         'text': segment.text.strip()
                     })
+
+                    if duration > 0:
+                        done = min(segment.end / duration, 1.0)
+                        self.progress_update.emit(40 + int(done * (progress_end - 40)))
+                        if (i + 1) % 25 == 0:
+                            self.status_update.emit(
+                                f"Transcribed {self._seconds_to_srt_time(segment.end)} of "
+                                f"{self._seconds_to_srt_time(duration)} ({i + 1} segments)"
+                            )
             
             else:  # Online extraction via OpenAI
                 if not self.api_key:
-                    self.translation_finished.emit("✗ Error: OpenAI API key required for online extraction")
+                    self.translation_finished.emit("✗ Error: OpenAI API key required for online extraction", None)
                     return
 
                 self.status_update.emit("Extracting audio for OpenAI Whisper API...")
@@ -322,7 +515,7 @@ class WhisperTranslateThread(QThread):
                     with open(output_path, 'w', encoding='utf-8') as f:
                         f.write(transcript_srt)
                     self.progress_update.emit(100)
-                    self.translation_finished.emit(f"✓ Done: {os.path.basename(output_path)} (Extracted via OpenAI)")
+                    self.translation_finished.emit(f"✓ Done: {os.path.basename(output_path)} (Extracted via OpenAI)", None)
                     return
                 
                 # Otherwise, parse for translation
@@ -330,7 +523,7 @@ class WhisperTranslateThread(QThread):
 
             total = len(srt_segments)
             if total == 0:
-                self.translation_finished.emit("✗ Error: No speech detected")
+                self.translation_finished.emit("✗ Error: No speech detected", None)
                 return
 
             # PHASE 2: SAVE ORIGINAL IF REQUESTED (Offline Path Only, Online already returned)
@@ -342,7 +535,7 @@ class WhisperTranslateThread(QThread):
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(srt_content)
                 self.progress_update.emit(100)
-                self.translation_finished.emit(f"✓ Done: {os.path.basename(output_path)} (Extracted: {total} segments)")
+                self.translation_finished.emit(f"✓ Done: {os.path.basename(output_path)} (Extracted: {total} segments)", None)
                 return
 
             # PHASE 3: TRANSLATE TO ARABIC
@@ -351,7 +544,7 @@ class WhisperTranslateThread(QThread):
                 self.progress_update.emit(50)
                 
                 if not self.api_key:
-                    self.translation_finished.emit("✗ Error: OpenAI API key required")
+                    self.translation_finished.emit("✗ Error: OpenAI API key required", None)
                     return
 
                 from openai import OpenAI
@@ -379,18 +572,19 @@ class WhisperTranslateThread(QThread):
                 self.progress_update.emit(50)
                 
                 if not ARGOS_AVAILABLE:
-                    self.translation_finished.emit("✗ Error: Argos Translate not installed")
+                    self.translation_finished.emit("✗ Error: Argos Translate not installed", None)
                     return
 
-                try:
-                    package.update_package_index()
-                except:
-                    pass
+                ModelCache.ensure_argos_index()
+                translation = ModelCache.argos_translation("en", "ar")
+                if translation is None:
+                    self.translation_finished.emit("✗ Error: Argos English → Arabic package not installed", None)
+                    return
                 
                 for i, segment in enumerate(srt_segments):
                     if not CodeDetector.is_code_or_technical(segment['text']):
                         try:
-                            translated = translate.translate(segment['text'], "en", "ar")
+                            translated = translation.translate(segment['text'])
                             if translated and translated.strip():
                                 segment['text'] = translated
                         except Exception as e:
@@ -409,10 +603,10 @@ class WhisperTranslateThread(QThread):
                 f.write(srt_content)
 
             self.progress_update.emit(100)
-            self.translation_finished.emit(f"✓ Done: {os.path.basename(output_path)} (Translated: {total} segments)")
+            self.translation_finished.emit(f"✓ Done: {os.path.basename(output_path)} (Translated: {total} segments)", srt_segments)
 
         except Exception as e:
-            self.translation_finished.emit(f"✗ Error: {str(e)}")
+            self.translation_finished.emit(f"✗ Error: {str(e)}", None)
         
         finally:
             # PHASE 5: CLEANUP
@@ -437,7 +631,7 @@ class ArgosTranslateThread(QThread):
     
     status_update = Signal(str)
     progress_update = Signal(int)
-    translation_finished = Signal(str)
+    translation_finished = Signal(str, object)  # message, final cues (None unless a translated SRT was saved)
 
     def __init__(self, srt_path: str):
         super().__init__()
@@ -447,17 +641,18 @@ class ArgosTranslateThread(QThread):
         """Execute translation in background."""
         try:
             if not ARGOS_AVAILABLE:
-                self.translation_finished.emit("Error: Argos Translate not installed. Run: pip install argostranslate")
+                self.translation_finished.emit("Error: Argos Translate not installed. Run: pip install argostranslate", None)
                 return
 
             self.status_update.emit("Preparing language packages...")
             self.progress_update.emit(10)
 
             # Try to ensure language packages are available
-            try:
-                package.update_package_index()
-            except Exception:
-                pass  # Ignore if this fails
+            ModelCache.ensure_argos_index()
+            translation = ModelCache.argos_translation("en", "ar")
+            if translation is None:
+                self.translation_finished.emit("✗ Error: Argos English → Arabic package not installed", None)
+                return
 
             self.status_update.emit("Reading SRT file...")
             self.progress_update.emit(20)
@@ -469,7 +664,7 @@ class ArgosTranslateThread(QThread):
             total = len(subtitles)
 
             if total == 0:
-                self.translation_finished.emit("✗ Error: No subtitles found in file")
+                self.translation_finished.emit("✗ Error: No subtitles found in file", None)
                 return
 
             self.status_update.emit(f"Translating {total} subtitles...")
@@ -481,7 +676,7 @@ class ArgosTranslateThread(QThread):
                 if not CodeDetector.is_code_or_technical(subtitle['text']):
                     try:
                         original_text = subtitle['text']
-                        translated = translate.translate(subtitle['text'], "en", "ar")
+                        translated = translation.translate(subtitle['text'])
                         # Validate translation output - never leave blank
                         if translated and len(translated.strip()) > 0:
                             subtitle['text'] = translated
@@ -499,17 +694,17 @@ class ArgosTranslateThread(QThread):
             self.status_update.emit(f"✓ Translated {translated_count}/{total} subtitles to Arabic")
 
             # Save translated SRT
-            output_path = self.srt_path.replace('.srt', '.ar.srt')
+            output_path = SRTParser.arabic_output_path(self.srt_path)
             output_content = SRTParser.format(subtitles)
 
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(output_content)
 
             self.progress_update.emit(100)
-            self.translation_finished.emit(f"✓ Done: {os.path.basename(output_path)} (Translated: {translated_count}/{total})")
+            self.translation_finished.emit(f"✓ Done: {os.path.basename(output_path)} (Translated: {translated_count}/{total})", subtitles)
 
         except Exception as e:
-            self.translation_finished.emit(f"✗ Error: {str(e)}")
+            self.translation_finished.emit(f"✗ Error: {str(e)}", None)
 
 
 class ChatGPTTranslateThread(QThread):
@@ -517,7 +712,7 @@ class ChatGPTTranslateThread(QThread):
     
     status_update = Signal(str)
     progress_update = Signal(int)
-    translation_finished = Signal(str)
+    translation_finished = Signal(str, object)  # message, final cues (None unless a translated SRT was saved)
 
     SYSTEM_PROMPT = """You are a professional technical translator specializing in programming tutorials and documentation.
 Your task is to translate subtitle text from English to Arabic with these rules:
@@ -531,6 +726,9 @@ Your task is to translate subtitle text from English to Arabic with these rules:
 
 Output ONLY the translated text, nothing else."""
 
+    MAX_WORKERS = 4  # Batch requests in flight at once
+    LOG_FLUSH_INTERVAL = 0.1  # Seconds between batched status updates
+
     def __init__(self, srt_path: str, api_key: str, model: str = "gpt-4-turbo"):
         super().__init__()
         self.srt_path = srt_path
@@ -538,20 +736,113 @@ Output ONLY the translated text, nothing else."""
         self.model = model
         self.translated_count = 0
         self.skipped_count = 0
+        self._log_lock = threading.Lock()
+        self._log_buf: List[str] = []
+        self._last_flush = 0.0
+
+    def _log(self, message: str):
+        """Queue a status line from a worker thread; sent by _flush_log."""
+        with self._log_lock:
+            self._log_buf.append(message)
+
+    def _flush_log(self, force: bool = False):
+        """Send queued status lines as one update, at most every LOG_FLUSH_INTERVAL unless forced."""
+        now = time.monotonic()
+        with self._log_lock:
+            if not self._log_buf or (not force and now - self._last_flush < self.LOG_FLUSH_INTERVAL):
+                return
+            lines = self._log_buf
+            self._log_buf = []
+            self._last_flush = now
+        self.status_update.emit("\n".join(lines))
+
+    def _complete(self, client, user_content: str, max_tokens: int, as_json: bool = False) -> str:
+        """Send one chat completion request and return the reply text."""
+        extra = {"response_format": {"type": "json_object"}} if as_json else {}
+        response = client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": user_content}
+            ],
+            temperature=0.3,
+            max_tokens=max_tokens,
+            **extra
+        )
+        if response.choices and len(response.choices) > 0:
+            return (response.choices[0].message.content or "").strip()
+        return ""
+
+    def _translate_batch(self, client, batch: List[Dict[str, str]], split: bool = True) -> List[str]:
+        """
+        Translate a batch of subtitles with a single request.
+        If the reply cannot be mapped back by number the batch is split in half and
+        retried once (split=False for the halves); if a half fails too, its subtitles
+        are sent one per request. Subtitles missing from an otherwise valid reply
+        are retried on their own.
+
+        Returns:
+            Translations in batch order ("" where translation failed)
+        """
+        texts = [subtitle['text'].strip() for subtitle in batch]
+        try:
+            if len(batch) == 1:
+                return [self._complete(client, texts[0], 500)]
+            content = self._complete(
+                client,
+                SubtitleBatcher.build_prompt(texts),
+                SubtitleBatcher.MAX_TOKENS,
+                as_json=SubtitleBatcher.supports_json_mode(self.model)
+            )
+        except Exception as e:
+            error_msg = str(e)
+            # Provide helpful error diagnostics
+            if "model_not_found" in error_msg or "does not have access" in error_msg:
+                self._log(f"⚠ Model '{self.model}' not available. Try: gpt-4, gpt-4-turbo, gpt-4o, gpt-4o-mini")
+            else:
+                self._log(f"⚠ API Error for {len(batch)} subtitle(s): {error_msg[:100]}")
+            return [""] * len(batch)
+
+        results = SubtitleBatcher.parse_response(content, len(batch))
+        if results is None or not any(results):
+            if split:
+                half = len(batch) // 2
+                return (self._translate_batch(client, batch[:half], split=False)
+                        + self._translate_batch(client, batch[half:], split=False))
+            return self._translate_lines(client, batch)
+
+        missing = [i for i, translated in enumerate(results) if not translated]
+        if missing:
+            retried = self._translate_lines(client, [batch[i] for i in missing])
+            for i, translated in zip(missing, retried):
+                results[i] = translated
+        return results
+
+    def _translate_lines(self, client, batch: List[Dict[str, str]]) -> List[str]:
+        """Translate subtitles with one request each, the last resort for replies that cannot be parsed."""
+        return [self._translate_batch(client, [subtitle])[0] for subtitle in batch]
 
     def run(self):
         """Execute translation in background."""
+        client = None
         try:
             if not OPENAI_AVAILABLE:
-                self.translation_finished.emit("Error: OpenAI library not installed. Run: pip install openai")
+                self.translation_finished.emit("Error: OpenAI library not installed. Run: pip install openai", None)
                 return
 
             if not self.api_key or self.api_key.strip() == "":
-                self.translation_finished.emit("✗ Error: OpenAI API key not provided")
+                self.translation_finished.emit("✗ Error: OpenAI API key not provided", None)
                 return
 
-            # Initialize OpenAI client with API key
-            client = OpenAI(api_key=self.api_key)
+            # One pooled keep-alive (HTTP/2 when available) connection set shared by every batch request
+            client = OpenAI(
+                api_key=self.api_key,
+                http_client=httpx.Client(
+                    http2=HTTP2_AVAILABLE,
+                    timeout=httpx.Timeout(60.0, connect=10.0),
+                    limits=httpx.Limits(max_connections=self.MAX_WORKERS, max_keepalive_connections=self.MAX_WORKERS)
+                )
+            )
 
             self.status_update.emit("Reading SRT file...")
             self.progress_update.emit(10)
@@ -563,7 +854,7 @@ Output ONLY the translated text, nothing else."""
             total = len(subtitles)
 
             if total == 0:
-                self.translation_finished.emit("✗ Error: No subtitles found in file")
+                self.translation_finished.emit("✗ Error: No subtitles found in file", None)
                 return
 
             self.status_update.emit(f"Translating {total} subtitles with ChatGPT...")
@@ -571,65 +862,38 @@ Output ONLY the translated text, nothing else."""
             self.translated_count = 0
             self.skipped_count = 0
 
-            # Translate each subtitle
-            for i, subtitle in enumerate(subtitles):
-                text_to_translate = subtitle['text'].strip()
-                original_text = subtitle['text']  # Save original before any modification
-                
-                # Skip if text is empty - strict code checking is DISABLED for generic AI models as they handle context better
-                if not text_to_translate:
-                    self.skipped_count += 1
-                # elif CodeDetector.is_code_or_technical(text_to_translate):
-                #     self.skipped_count += 1
+            # Skip empty text - strict code checking is DISABLED for generic AI models as they handle context better
+            pending = []
+            for subtitle in subtitles:
+                if subtitle['text'].strip():
+                    pending.append(subtitle)
                 else:
-                    try:
-                        # Call ChatGPT with modern API
-                        response = client.chat.completions.create(
-                            model=self.model,
-                            messages=[
-                                {"role": "system", "content": self.SYSTEM_PROMPT},
-                                {"role": "user", "content": text_to_translate}
-                            ],
-                            temperature=0.3,
-                            max_tokens=500
-                        )
-                        
-                        if response.choices and len(response.choices) > 0:
-                            translated = response.choices[0].message.content.strip()
-                            # IMPORTANT: Never leave text blank - fallback to original if translation fails
-                            if translated and len(translated) > 0:
-                                subtitle['text'] = translated
-                                self.translated_count += 1
-                            else:
-                                # Fallback: keep original text to avoid losing content
-                                subtitle['text'] = original_text
-                                self.status_update.emit(f"⚠ Subtitle {i+1}: Empty response, kept original text")
-                                self.skipped_count += 1
+                    self.skipped_count += 1
+
+            # Several subtitles per request, a few requests in flight at once
+            batches = SubtitleBatcher.make_batches(pending, self.model)
+            done = self.skipped_count
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures = {executor.submit(self._translate_batch, client, batch): batch for batch in batches}
+                for future in as_completed(futures):
+                    batch = futures[future]
+                    for subtitle, translated in zip(batch, future.result()):
+                        # IMPORTANT: Never leave text blank - keep the original if translation failed
+                        if translated:
+                            subtitle['text'] = translated
+                            self.translated_count += 1
                         else:
-                            # No response received - keep original text
-                            subtitle['text'] = original_text
-                            self.status_update.emit(f"⚠ Subtitle {i+1}: No response received, kept original text")
                             self.skipped_count += 1
-                            
-                    except Exception as e:
-                        error_msg = str(e)
-                        # IMPORTANT: Keep original text on any error to ensure no data loss
-                        subtitle['text'] = original_text
-                        # Provide helpful error diagnostics
-                        if "model_not_found" in error_msg or "does not have access" in error_msg:
-                            self.status_update.emit(f"⚠ Model '{self.model}' not available. Try: gpt-4, gpt-4-turbo, gpt-4o, gpt-4o-mini")
-                        else:
-                            self.status_update.emit(f"⚠ API Error for subtitle {i+1}: {error_msg[:100]}")
-                        self.skipped_count += 1
-
-                progress = 20 + int((i + 1) / total * 75)
-                self.progress_update.emit(progress)
+                    done += len(batch)
+                    self.progress_update.emit(20 + int(done / total * 75))
+                    self._flush_log()
+            self._flush_log(force=True)
 
             # Save translated SRT
             self.status_update.emit("Saving translated file...")
             self.progress_update.emit(95)
             
-            output_path = self.srt_path.replace('.srt', '.ar.srt')
+            output_path = SRTParser.arabic_output_path(self.srt_path)
             output_content = SRTParser.format(subtitles)
 
             with open(output_path, 'w', encoding='utf-8') as f:
@@ -637,10 +901,14 @@ Output ONLY the translated text, nothing else."""
 
             self.progress_update.emit(100)
             summary = f"✓ Done: {os.path.basename(output_path)} (Translated: {self.translated_count}, Skipped: {self.skipped_count})"
-            self.translation_finished.emit(summary)
+            self.translation_finished.emit(summary, subtitles)
 
         except Exception as e:
-            self.translation_finished.emit(f"✗ Error: {str(e)}")
+            self._flush_log(force=True)
+            self.translation_finished.emit(f"✗ Error: {str(e)}", None)
+        finally:
+            if client is not None:
+                client.close()
 
 
 # ===================== GUI APPLICATION =====================
@@ -648,15 +916,53 @@ Output ONLY the translated text, nothing else."""
 class TranslatorApp(QWidget):
     """Main GUI application for translation with batch processing support."""
 
+    QUEUE_STATUS_ICONS = {
+        TranslationStatus.PENDING: "⏳",
+        TranslationStatus.RUNNING: "⚙️",
+        TranslationStatus.COMPLETED: "✓",
+        TranslationStatus.FAILED: "✗",
+        TranslationStatus.SKIPPED: "⊘"
+    }
+
+    QUEUE_STATUS_COLORS = {
+        TranslationStatus.COMPLETED: "green",
+        TranslationStatus.RUNNING: "blue",
+        TranslationStatus.FAILED: "red",
+        TranslationStatus.PENDING: "gray"
+    }
+
     def __init__(self):
         super().__init__()
         self.thread = None
         self.batch_processor = None  # Will be created when needed
         self.batch_jobs = []  # List of jobs to process
+        self._job_pool = JobPool()  # Recycles TranslationJob objects between queues
+        self._last_srt_dir = os.path.expanduser('~')  # SRT dialogs reopen where the last pick was made
+        self._job_by_id = {}  # job_id -> TranslationJob, index over batch_jobs
+        self._queue_items = {}  # job_id -> QListWidgetItem in batch_queue_list
+        self._active_items = []  # QListWidgetItems currently shown, in row order
+        self._item_pool = []  # Detached QListWidgetItems kept for reuse
+        self._trans_cache = TranslationCache()  # Shared by all batch jobs to skip repeated lines
+        # One executor for every Argos batch job, so parallel jobs share the cores instead of
+        # each starting cpu_count threads of its own
+        self._argos_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="argos")
+        self._pending_updates = {}  # job_id -> (progress, message), latest only
         self.batch_manager = None
+        self._batch_stopping = False  # Stop pressed, waiting for batch_finished
         self.current_engine = None
+        # Shared across all ChatGPT batch jobs (see _ensure_openai_batch_client)
+        self._openai_lock = threading.Lock()
+        self._async_runner = None
+        self._openai_client = None
+        self._rate_limiter = None
         self.init_ui()
 
+        # Coalesce batch progress events into at most one UI update every 50 ms
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(50)
+        self._progress_timer.timeout.connect(self.flush_batch_progress)
+
     def closeEvent(self, event):
         """Handle application close event - clean up threads."""
         self.cleanup_threads()
@@ -673,6 +979,53 @@ class TranslatorApp(QWidget):
         if self.thread and self.thread.isRunning():
             self.thread.wait(timeout=5000)
 
+        # Jobs still running would block on a stopped loop; the daemon loop thread exits with the app
+        if not (self.batch_manager and self.batch_manager.isRunning()):
+            self._close_openai_batch_client()
+        self._argos_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_openai_batch_client(self, api_key: str, rpm: int = 500, tpm: int = 200000):
+        """
+        Create the shared AsyncOpenAI client, event loop and rate limiter for batch jobs.
+
+        One client (and so one httpx connection pool) is reused by every file in
+        the batch, so TLS handshakes and connection setup happen once. With h2
+        installed, concurrent requests are multiplexed over HTTP/2 connections.
+        Safe to call from several worker threads.
+        """
+        with self._openai_lock:
+            if self._openai_client is not None:
+                return
+            self._async_runner = AsyncRunner()
+            # Retries (429s with their retry-after headers, timeouts, dropped connections
+            # and 5xx) are handled by RateLimiter, which also stops waiting on Stop
+            self._openai_client = AsyncOpenAI(
+                api_key=api_key,
+                max_retries=0,
+                http_client=httpx.AsyncClient(
+                    http2=HTTP2_AVAILABLE,
+                    timeout=httpx.Timeout(60.0, connect=10.0),
+                    limits=httpx.Limits(max_connections=128, max_keepalive_connections=64)
+                )
+            )
+            self._rate_limiter = RateLimiter(rpm=rpm, tpm=tpm)
+
+    def _close_openai_batch_client(self):
+        """Close the shared batch client and stop its event loop."""
+        with self._openai_lock:
+            runner, client = self._async_runner, self._openai_client
+            self._async_runner = None
+            self._openai_client = None
+            self._rate_limiter = None
+
+        if runner is None:
+            return
+        try:
+            runner.run(client.close())
+        except Exception:
+            pass
+        runner.close()
+
     def init_ui(self):
         """Initialize UI components."""
         self.setWindowTitle("Translation Studio - Batch Translation to Arabic")
@@ -690,8 +1043,7 @@ class TranslatorApp(QWidget):
         author_label.setStyleSheet("color: gray;")
         main_layout.addWidget(author_label)
         
-        separator = QLabel("─" * 100)
-        main_layout.addWidget(separator)
+        main_layout.addWidget(self._make_separator())
 
         # Create tabs for single and batch mode
         self.tabs = QTabWidget()
@@ -823,8 +1175,8 @@ class TranslatorApp(QWidget):
         parallel_layout.addWidget(QLabel("Parallel Jobs:"))
         self.parallel_jobs_spin = QSpinBox()
         self.parallel_jobs_spin.setMinimum(1)
-        self.parallel_jobs_spin.setMaximum(4)
-        self.parallel_jobs_spin.setValue(2)
+        self.parallel_jobs_spin.setMaximum(64)
+        self.parallel_jobs_spin.setValue(min(64, max(1, QThread.idealThreadCount())))
         parallel_layout.addWidget(self.parallel_jobs_spin)
         parallel_layout.addStretch()
         batch_layout.addLayout(parallel_layout)
@@ -843,6 +1195,10 @@ class TranslatorApp(QWidget):
         # Queue display
         self.batch_queue_list = QListWidget()
         self.batch_queue_list.setMaximumHeight(200)
+        # All rows are one line of text: skip per-item size queries and lay out in batches
+        self.batch_queue_list.setUniformItemSizes(True)
+        self.batch_queue_list.setLayoutMode(QListView.Batched)
+        self.batch_queue_list.setBatchSize(100)
         batch_layout.addWidget(QLabel("📋 Translation Queue:"))
         batch_layout.addWidget(self.batch_queue_list)
 
@@ -868,8 +1224,7 @@ class TranslatorApp(QWidget):
         main_layout.addWidget(self.tabs)
 
         # ===== Progress and Status (Common) =====
-        separator = QLabel("─" * 100)
-        main_layout.addWidget(separator)
+        main_layout.addWidget(self._make_separator())
 
         self.progress = QProgressBar()
         self.progress.setValue(0)
@@ -884,10 +1239,19 @@ class TranslatorApp(QWidget):
         self.log_area.setReadOnly(True)
         self.log_area.setMaximumHeight(150)
         self.log_area.setPlaceholderText("Translation logs will appear here...")
+        self.log_area.document().setMaximumBlockCount(1000)  # Keep log memory bounded
         main_layout.addWidget(self.log_area)
 
         self.setLayout(main_layout)
 
+    @staticmethod
+    def _make_separator() -> QFrame:
+        """Create a horizontal separator line."""
+        separator = QFrame()
+        separator.setFrameShape(QFrame.HLine)
+        separator.setFrameShadow(QFrame.Sunken)
+        return separator
+
     def update_batch_ui(self):
         """Update batch UI based on selected engine."""
         is_chatgpt = "ChatGPT" in self.batch_engine_combo.currentText()
@@ -900,11 +1264,12 @@ class TranslatorApp(QWidget):
         file_paths, _ = QFileDialog.getOpenFileNames(
             self,
             "Select SRT Files for Batch Processing",
-            "",
+            self._last_srt_dir,
             "SRT Files (*.srt);;All Files (*)"
         )
 
         if file_paths:
+            self._last_srt_dir = os.path.dirname(file_paths[0])
             engine = "chatgpt" if "ChatGPT" in self.batch_engine_combo.currentText() else "argos"
             
             config = {}
@@ -917,59 +1282,97 @@ class TranslatorApp(QWidget):
                 config["model"] = self.batch_chatgpt_model_combo.currentText()
 
             # Create translation jobs
-            from batch_processor import TranslationEngineType as EngineType
             
+            self._release_batch_jobs()
             self.batch_jobs = []
-            engine_type = EngineType.CHATGPT if engine == "chatgpt" else EngineType.ARGOS
+            self._job_by_id = {}
+            engine_type = TranslationEngineType.CHATGPT if engine == "chatgpt" else TranslationEngineType.ARGOS
             
+            queued = set()
             for file_path in file_paths:
+                # Two jobs for one input file would write the same output, so keep the first
+                key = os.path.normcase(os.path.abspath(file_path))
+                if key in queued:
+                    self.log_area.append(f"[Batch] Skipped duplicate: {os.path.basename(file_path)}")
+                    continue
                 if os.path.exists(file_path):
-                    job = TranslationJob(
-                        file_path=file_path,
-                        engine=engine_type,
-                        config=config
+                    queued.add(key)
+                    job = self._job_pool.acquire(
+                        file_path,
+                        engine_type,
+                        dict(config)  # Each job stores its own callbacks in config
                     )
                     self.batch_jobs.append(job)
+                    self._job_by_id[job.job_id] = job
                     self.log_area.append(f"[Batch] Added: {os.path.basename(file_path)}")
             
             self.log_area.append(f"[Batch] ✓ Ready to translate {len(self.batch_jobs)} file(s)")
             self.refresh_batch_queue_display()
 
+    def _release_batch_jobs(self):
+        """
+        Return the queued jobs to the job pool.
+        Skipped while a processor is still running: its workers hold these job objects,
+        and a reset job would report under its new job_id into the next queue.
+        """
+        if self.batch_manager and self.batch_manager.isRunning():
+            return
+        for job in self.batch_jobs:
+            self._job_pool.release(job)
+
     def batch_clear_queue(self):
         """Clear the batch processing queue."""
-        self.batch_jobs.clear()
-        self.batch_queue_list.clear()
+        self._release_batch_jobs()
+        self.batch_jobs = []
+        self._job_by_id.clear()
+        self.refresh_batch_queue_display()  # Returns all list items to the pool
         self.log_area.append("[Batch] Queue cleared")
 
     def refresh_batch_queue_display(self):
-        """Update batch queue list display."""
-        self.batch_queue_list.clear()
-        
-        for job in self.batch_jobs:
-            filename = os.path.basename(job.file_path)
-            status_icon = {
-                TranslationStatus.PENDING: "⏳",
-                TranslationStatus.RUNNING: "⚙️",
-                TranslationStatus.COMPLETED: "✓",
-                TranslationStatus.FAILED: "✗",
-                TranslationStatus.SKIPPED: "⊘"
-            }.get(job.status, "❓")
-
-            item_text = f"{status_icon} {filename} | {job.engine.value.upper()} | {job.progress}%"
-            
-            item = QListWidgetItem(item_text)
-            
-            # Color code by status
-            if job.status == TranslationStatus.COMPLETED:
-                item.setForeground(QColor("green"))
-            elif job.status == TranslationStatus.RUNNING:
-                item.setForeground(QColor("blue"))
-            elif job.status == TranslationStatus.FAILED:
-                item.setForeground(QColor("red"))
-            elif job.status == TranslationStatus.PENDING:
-                item.setForeground(QColor("gray"))
-
-            self.batch_queue_list.addItem(item)
+        """
+        Sync the batch queue list with batch_jobs (used when the queue changes).
+        Existing list items are reused in place and surplus ones go back to a pool,
+        so rebuilding the queue does not allocate new items in the steady state.
+        """
+        self.batch_queue_list.setUpdatesEnabled(False)
+        self.batch_queue_list.blockSignals(True)
+        try:
+            self._queue_items.clear()
+
+            for row, job in enumerate(self.batch_jobs):
+                if row < len(self._active_items):
+                    item = self._active_items[row]
+                else:
+                    item = self._item_pool.pop() if self._item_pool else QListWidgetItem()
+                    self._active_items.append(item)
+                    self.batch_queue_list.addItem(item)
+                self._queue_items[job.job_id] = item
+                self.update_batch_queue_item(job)
+
+            # Detach surplus items (takeItem keeps them alive) instead of deleting them
+            while len(self._active_items) > len(self.batch_jobs):
+                self.batch_queue_list.takeItem(self.batch_queue_list.count() - 1)
+                self._item_pool.append(self._active_items.pop())
+        finally:
+            self.batch_queue_list.blockSignals(False)
+            self.batch_queue_list.setUpdatesEnabled(True)
+
+    def update_batch_queue_item(self, job: TranslationJob):
+        """Update the queue list entry of a single job in place."""
+        item = self._queue_items.get(job.job_id)
+        if item is None:
+            return
+
+        filename = os.path.basename(job.file_path)
+        status_icon = self.QUEUE_STATUS_ICONS.get(job.status, "❓")
+        item.setText(f"{status_icon} {filename} | {job.engine.value.upper()} | {job.progress}%")
+
+        # Color code by status
+        color = self.QUEUE_STATUS_COLORS.get(job.status)
+        if color:
+            item.setForeground(QColor(color))
+        else:
+            item.setData(Qt.ForegroundRole, None)
 
     def batch_start_processing(self):
         """Start batch translation processing."""
@@ -990,11 +1393,25 @@ class TranslatorApp(QWidget):
         engine_text = self.batch_engine_combo.currentText()
         if "ChatGPT" in engine_text:
             executor = self.execute_chatgpt_batch_job
+            if OPENAI_AVAILABLE:
+                config = self.batch_jobs[0].config
+                self._ensure_openai_batch_client(
+                    config.get('api_key', ''), config.get('rpm', 500), config.get('tpm', 200000)
+                )
         else:
             executor = self.execute_argos_batch_job
 
+        # Parallel Jobs sets both the number of files in flight and each file's
+        # concurrent ChatGPT requests (the asyncio semaphore in _chatgpt_translate_all)
+        parallel_jobs = self.parallel_jobs_spin.value()
+        for job in self.batch_jobs:
+            job.config['concurrency'] = parallel_jobs
+
         # Create and start the batch processor
-        self.batch_manager = SimpleBatchProcessor(self.batch_jobs, executor)
+        self.batch_manager = SimpleBatchProcessor(
+            self.batch_jobs, executor,
+            max_parallel=parallel_jobs
+        )
         
         # Connect signals
         self.batch_manager.job_started.connect(self.on_batch_job_started)
@@ -1006,12 +1423,20 @@ class TranslatorApp(QWidget):
         self.batch_manager.start()
 
     def batch_stop_processing(self):
-        """Stop batch translation."""
+        """
+        Stop batch translation.
+        Running jobs can take a while to notice (a request in flight, a rate-limit wait),
+        so the UI stays locked until the processor emits batch_finished; starting a new
+        batch earlier would share the OpenAI client and pooled jobs with the old one.
+        """
+        self.batch_stop_btn.setEnabled(False)
         if self.batch_manager and self.batch_manager.isRunning():
-            self.batch_manager.stop()
-            self.batch_manager.wait(timeout=5000)  # Wait up to 5 seconds for thread to finish
-        self.batch_reset_ui()
-        self.log_area.append("[Batch] ⏹️ Processing stopped")
+            self._batch_stopping = True
+            self.batch_manager.stop(wait=False)
+            self.log_area.append("[Batch] ⏹️ Stopping... waiting for running jobs to finish")
+        else:
+            self.batch_reset_ui()
+            self.log_area.append("[Batch] ⏹️ Processing stopped")
 
     def batch_reset_ui(self):
         """Reset batch UI after processing."""
@@ -1024,51 +1449,65 @@ class TranslatorApp(QWidget):
 
     def on_batch_job_started(self, job_id: str):
         """Handle batch job start."""
-        # Find the job with this ID in our batch_jobs list
-        job = None
-        for j in self.batch_jobs:
-            if j.job_id == job_id:
-                job = j
-                break
-        
+        job = self._job_by_id.get(job_id)
         if job:
             filename = os.path.basename(job.file_path)
             self.log_area.append(f"[{job.engine.value.upper()}] Starting: {filename}")
+            self.update_batch_queue_item(job)
 
     def on_batch_job_progress(self, job_id: str, progress: int, message: str):
-        """Handle batch job progress."""
-        if message:
+        """Queue a batch job progress update; flushed by the coalescing timer."""
+        if message.startswith("⚠"):
+            # Warnings are rare and must not be coalesced away
             self.log_area.append(f"  {message}")
-        self.refresh_batch_queue_display()
+        self._pending_updates[job_id] = (progress, message)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def flush_batch_progress(self):
+        """
+        Apply the latest pending progress update of each job to its queue row.
+        Progress is not logged: the rows show it, and the capped log is kept for
+        warnings and completion/failure lines.
+        """
+        pending = self._pending_updates
+        self._pending_updates = {}
+
+        for job_id, (progress, message) in pending.items():
+            job = self._job_by_id.get(job_id)
+            if job is None:
+                continue
+            job.progress = progress
+            self.update_batch_queue_item(job)
+
+    def _log_job_summary(self, job: TranslationJob):
+        """
+        Drop a finished job's stale progress update and log the summary its executor
+        left in job.message (the ChatGPT token/cost line), if any.
+        """
+        self._pending_updates.pop(job.job_id, None)
+        if job.message:
+            self.log_area.append(f"  {os.path.basename(job.file_path)}: {job.message}")
 
     def on_batch_job_completed(self, job_id: str, output_path: str):
         """Handle batch job completion."""
-        # Find the job with this ID in our batch_jobs list
-        job = None
-        for j in self.batch_jobs:
-            if j.job_id == job_id:
-                job = j
-                break
-        
+        job = self._job_by_id.get(job_id)
         if job:
             filename = os.path.basename(job.file_path)
             output_name = os.path.basename(output_path) if output_path else "unknown"
+            self._log_job_summary(job)
             self.log_area.append(f"[{job.engine.value.upper()}] Completed: {filename} -> {output_name}")
-        self.refresh_batch_queue_display()
+            job.progress = 100
+            self.update_batch_queue_item(job)
 
     def on_batch_job_failed(self, job_id: str, error_message: str):
         """Handle batch job failure."""
-        # Find the job with this ID in our batch_jobs list
-        job = None
-        for j in self.batch_jobs:
-            if j.job_id == job_id:
-                job = j
-                break
-        
+        job = self._job_by_id.get(job_id)
         if job:
             filename = os.path.basename(job.file_path)
+            self._log_job_summary(job)
             self.log_area.append(f"[{job.engine.value.upper()}] Failed: {filename} - {error_message}")
-        self.refresh_batch_queue_display()
+            self.update_batch_queue_item(job)
 
     def on_batch_queue_updated(self, stats: dict):
         """Handle queue statistics update."""
@@ -1100,8 +1539,17 @@ class TranslatorApp(QWidget):
         completed = final_stats.get("completed", 0)
         failed = final_stats.get("failed", 0)
         
+        self._progress_timer.stop()
+        self.flush_batch_progress()
+        # Only now is no job of this batch using the shared client
+        self._close_openai_batch_client()
+
         self.log_area.append("\n" + "="*70)
-        self.log_area.append(f"[Batch] 🎉 All jobs completed!")
+        if self._batch_stopping:
+            self._batch_stopping = False
+            self.log_area.append("[Batch] ⏹️ Processing stopped")
+        else:
+            self.log_area.append(f"[Batch] 🎉 All jobs completed!")
         self.log_area.append(f"[Batch] Total: {total} | Completed: {completed} | Failed: {failed}")
         self.log_area.append("="*70 + "\n")
         
@@ -1113,6 +1561,13 @@ class TranslatorApp(QWidget):
         # Redirect to new handler for backward compatibility
         self.on_batch_finished(final_stats)
 
+    @staticmethod
+    def _drain_argos_futures(futures):
+        """Cancel a job's queued Argos lines and wait for its running ones, so nothing is left on the shared executor."""
+        for future in futures:
+            future.cancel()
+        wait_futures(futures)
+
     def execute_argos_batch_job(self, job) -> bool:
         """Execute single Argos translation job."""
         try:
@@ -1125,20 +1580,19 @@ class TranslatorApp(QWidget):
             on_progress = job.config.get('_on_progress', lambda *args: None)
             on_completed = job.config.get('_on_completed', lambda *args: None)
             on_failed = job.config.get('_on_failed', lambda *args: None)
+            should_stop = job.config.get('_should_stop', lambda: False)
 
             on_progress(20, "Preparing language packages...")
 
-            try:
-                package.update_package_index()
-            except Exception:
-                pass
+            ModelCache.ensure_argos_index()
+            translation = ModelCache.argos_translation("en", "ar")
+            if translation is None:
+                on_failed("Argos English → Arabic package not installed")
+                return False
 
             on_progress(30, "Reading SRT file...")
 
-            with open(job.file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            subtitles = SRTParser.parse(content)
+            subtitles = SRTParser.parse_file(job.file_path)
             total = len(subtitles)
 
             if total == 0:
@@ -1147,24 +1601,57 @@ class TranslatorApp(QWidget):
 
             on_progress(40, f"Translating {total} subtitles...")
 
+            # Group repeated lines so each distinct text is translated once
+            groups = {}
             for i, subtitle in enumerate(subtitles):
-                if not CodeDetector.is_code_or_technical(subtitle['text']):
+                text = subtitle['text']
+                if text.strip() and not CodeDetector.is_code_or_technical(text):
+                    groups.setdefault(TranslationCache.normalize(text), []).append(i)
+
+            done = total - sum(len(group) for group in groups.values())  # Skipped subtitles count as done
+            pending = {}
+            for key, group in groups.items():
+                cached = self._trans_cache.get("argos", subtitles[group[0]]['text'])
+                if cached is None:
+                    pending[key] = group
+                    continue
+                for i in group:
+                    subtitles[i]['text'] = cached
+                done += len(group)
+
+            # Argos (CTranslate2) releases the GIL during inference; how many translations
+            # actually run at once is set by Argos' inter_threads (ARGOS_INTER_THREADS)
+            futures = {
+                self._argos_executor.submit(translation.translate, subtitles[group[0]]['text']): group
+                for group in pending.values()
+            }
+            try:
+                for future in as_completed(futures):
+                    if should_stop():
+                        self._drain_argos_futures(futures)
+                        on_failed("Stopped by user")
+                        return False
+
+                    group = futures[future]
                     try:
-                        translated = translate.translate(subtitle['text'], "en", "ar")
-                        subtitle['text'] = translated
+                        translated = future.result()
+                        if translated and translated.strip():
+                            self._trans_cache.put("argos", subtitles[group[0]]['text'], translated)
+                            for i in group:
+                                subtitles[i]['text'] = translated
                     except Exception:
                         pass
 
-                progress = 40 + int((i + 1) / total * 55)
-                on_progress(progress, f"Translated {i+1}/{total}")
+                    done += len(group)
+                    progress = 40 + int(done / total * 55)
+                    on_progress(progress, f"Translated {done}/{total}")
+            finally:
+                self._drain_argos_futures(futures)
 
             on_progress(95, "Saving file...")
 
-            output_path = job.file_path.replace('.srt', '.ar.srt')
-            output_content = SRTParser.format(subtitles)
-
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(output_content)
+            output_path = SRTParser.arabic_output_path(job.file_path)
+            SRTParser.write_file(output_path, subtitles)
 
             on_completed(output_path)
             return True
@@ -1186,6 +1673,7 @@ class TranslatorApp(QWidget):
             on_progress = job.config.get('_on_progress', lambda *args: None)
             on_completed = job.config.get('_on_completed', lambda *args: None)
             on_failed = job.config.get('_on_failed', lambda *args: None)
+            should_stop = job.config.get('_should_stop', lambda: False)
 
             api_key = job.config.get('api_key', '')
             model = job.config.get('model', 'gpt-4-turbo')
@@ -1194,14 +1682,15 @@ class TranslatorApp(QWidget):
                 on_failed("API key not provided")
                 return False
 
-            client = OpenAI(api_key=api_key)
+            self._ensure_openai_batch_client(
+                api_key, job.config.get('rpm', 500), job.config.get('tpm', 200000)
+            )
+            runner, client, limiter = self._async_runner, self._openai_client, self._rate_limiter
+            concurrency = job.config.get('concurrency', 20)
 
             on_progress(20, "Reading SRT file...")
 
-            with open(job.file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            subtitles = SRTParser.parse(content)
+            subtitles = SRTParser.parse_file(job.file_path)
             total = len(subtitles)
 
             if total == 0:
@@ -1210,52 +1699,25 @@ class TranslatorApp(QWidget):
 
             on_progress(30, f"Translating {total} subtitles with ChatGPT...")
 
-            translated_count = 0
-            skipped_count = 0
-
-            for i, subtitle in enumerate(subtitles):
-                text_to_translate = subtitle['text'].strip()
-                
-                if not text_to_translate:
-                    skipped_count += 1
-                elif CodeDetector.is_code_or_technical(text_to_translate):
-                    skipped_count += 1
-                else:
-                    try:
-                        response = client.chat.completions.create(
-                            model=model,
-                            messages=[
-                                {"role": "system", "content": ChatGPTTranslateThread.SYSTEM_PROMPT},
-                                {"role": "user", "content": text_to_translate}
-                            ],
-                            temperature=0.3,
-                            max_tokens=500
-                        )
-                        
-                        if response.choices and len(response.choices) > 0:
-                            translated = response.choices[0].message.content.strip()
-                            if translated:
-                                subtitle['text'] = translated
-                                translated_count += 1
-                            else:
-                                skipped_count += 1
-                        else:
-                            skipped_count += 1
-                            
-                    except Exception as e:
-                        on_progress(0, f"⚠ API Error: {str(e)[:80]}")
-                        skipped_count += 1
+            counts = runner.run(
+                self._chatgpt_translate_all(client, limiter, model, subtitles, on_progress,
+                                            concurrency, should_stop)
+            )
 
-                progress = 30 + int((i + 1) / total * 65)
-                on_progress(progress, f"Translated {translated_count}, Skipped {skipped_count}")
+            if should_stop():
+                on_failed("Stopped by user")
+                return False
 
+            total_tokens = counts["prompt_tokens"] + counts["completion_tokens"]
+            cost = TokenCounter.estimate_cost(model, counts["prompt_tokens"], counts["completion_tokens"])
+            cost_text = f" (≈ ${cost:.4f})" if cost is not None else ""
+            # Logged when the job completes; progress messages are not
+            job.message = (f"Translated {counts['translated']}, Skipped {counts['skipped']} | "
+                           f"Tokens: {total_tokens}{cost_text}")
             on_progress(95, "Saving file...")
 
-            output_path = job.file_path.replace('.srt', '.ar.srt')
-            output_content = SRTParser.format(subtitles)
-
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(output_content)
+            output_path = SRTParser.arabic_output_path(job.file_path)
+            SRTParser.write_file(output_path, subtitles)
 
             on_completed(output_path)
             return True
@@ -1265,6 +1727,163 @@ class TranslatorApp(QWidget):
             on_failed(str(e))
             return False
 
+    async def _chatgpt_translate_all(self, client, limiter: RateLimiter, model: str,
+                                     subtitles: List[Dict[str, str]], on_progress: Callable,
+                                     concurrency: int, should_stop: Callable[[], bool]) -> Dict[str, int]:
+        """
+        Translate subtitles concurrently with ChatGPT, bounded by a semaphore.
+
+        Repeated lines are translated once and cached across files. Subtitles are
+        packed into numbered batches (see SubtitleBatcher) so the system prompt
+        and request overhead are paid once per batch. Batches whose
+        reply cannot be parsed are retried one subtitle at a time. Requests are paced
+        by the RateLimiter, which also retries rate-limited calls. Translations are
+        written back into each subtitle dict in place, so ordering is preserved.
+
+        Returns:
+            Counts of translated and skipped subtitles and the prompt/completion
+            tokens reported by the API
+        """
+        total = len(subtitles)
+        semaphore = asyncio.Semaphore(concurrency)
+        counts = {"translated": 0, "skipped": 0, "done": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        # The system prompt is identical for every request, so count it once
+        system_tokens = (TokenCounter.count(ChatGPTTranslateThread.SYSTEM_PROMPT, model)
+                         + TokenCounter.MESSAGE_OVERHEAD)
+        json_mode = SubtitleBatcher.supports_json_mode(model)
+        cache_engine = f"chatgpt:{model}"
+        duplicates = {}  # id(representative subtitle) -> all subtitles sharing its text
+
+        def current_progress() -> int:
+            return 30 + int(counts["done"] / total * 65)
+
+        def report():
+            counts["done"] += 1
+            on_progress(current_progress(), f"Translated {counts['translated']}, Skipped {counts['skipped']}")
+
+        def apply(subtitle: Dict[str, str], translated: str):
+            if translated:
+                self._trans_cache.put(cache_engine, subtitle['text'], translated)
+            for target in duplicates.get(id(subtitle), [subtitle]):
+                if translated:
+                    target['text'] = translated
+                    counts["translated"] += 1
+                else:
+                    counts["skipped"] += 1
+                report()
+
+        async def complete(user_content: str, max_tokens: int, as_json: bool = False) -> str:
+            extra = {"response_format": {"type": "json_object"}} if as_json else {}
+            estimated_tokens = system_tokens + TokenCounter.count(user_content, model) + max_tokens
+            async with semaphore:
+                if should_stop():
+                    return ""
+                try:
+                    response = await limiter.call(
+                        lambda: client.chat.completions.create(
+                            model=model,
+                            messages=[
+                                {"role": "system", "content": ChatGPTTranslateThread.SYSTEM_PROMPT},
+                                {"role": "user", "content": user_content}
+                            ],
+                            temperature=0.3,
+                            max_tokens=max_tokens,
+                            **extra
+                        ),
+                        estimated_tokens,
+                        should_stop
+                    )
+                except RequestCancelled:
+                    return ""
+            usage = getattr(response, "usage", None)
+            if usage is not None:
+                counts["prompt_tokens"] += usage.prompt_tokens or 0
+                counts["completion_tokens"] += usage.completion_tokens or 0
+            if response.choices and len(response.choices) > 0:
+                return (response.choices[0].message.content or "").strip()
+            return ""
+
+        async def translate_one(subtitle: Dict[str, str]):
+            try:
+                translated = await complete(subtitle['text'].strip(), 500)
+            except Exception as e:
+                translated = ""
+                on_progress(current_progress(), f"⚠ API Error: {str(e)[:80]}")
+            apply(subtitle, translated)
+
+        async def translate_batch(batch: List[Dict[str, str]]):
+            if should_stop():
+                for subtitle in batch:
+                    apply(subtitle, "")
+                return
+
+            if len(batch) == 1:
+                await translate_one(batch[0])
+                return
+
+            try:
+                content = await complete(
+                    SubtitleBatcher.build_prompt([sub['text'].strip() for sub in batch]),
+                    SubtitleBatcher.MAX_TOKENS,
+                    as_json=json_mode
+                )
+            except Exception as e:
+                on_progress(current_progress(), f"⚠ API Error: {str(e)[:80]}")
+                for subtitle in batch:
+                    apply(subtitle, "")
+                return
+
+            if should_stop():
+                for subtitle in batch:
+                    apply(subtitle, "")
+                return
+
+            results = SubtitleBatcher.parse_response(content, len(batch))
+            if results is None:
+                # Unusable reply - fall back to one request per subtitle
+                await asyncio.gather(*(translate_one(sub) for sub in batch))
+                return
+
+            missing = []
+            for subtitle, translated in zip(batch, results):
+                if translated:
+                    apply(subtitle, translated)
+                else:
+                    missing.append(subtitle)
+            await asyncio.gather(*(translate_one(sub) for sub in missing))
+
+        pending = []
+        representatives = {}  # normalized text -> first subtitle with that text
+        for subtitle in subtitles:
+            text_to_translate = subtitle['text'].strip()
+            # Skip empty lines and code up front to avoid wasted requests
+            if not text_to_translate or CodeDetector.is_code_or_technical(text_to_translate):
+                counts["skipped"] += 1
+                report()
+                continue
+
+            cached = self._trans_cache.get(cache_engine, text_to_translate)
+            if cached is not None:
+                subtitle['text'] = cached
+                counts["translated"] += 1
+                report()
+                continue
+
+            # Only unique lines go over the wire; duplicates receive the same reply
+            key = TranslationCache.normalize(text_to_translate)
+            representative = representatives.get(key)
+            if representative is None:
+                representatives[key] = subtitle
+                duplicates[id(subtitle)] = [subtitle]
+                pending.append(subtitle)
+            else:
+                duplicates[id(representative)].append(subtitle)
+
+        batches = SubtitleBatcher.make_batches(pending, model)
+        await asyncio.gather(*(translate_batch(batch) for batch in batches))
+
+        return counts
+
     def process_video(self, extract_only: bool = True, engine: str = "openai", extraction_engine: str = "whisper"):
         """Select and process video file."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1326,11 +1945,12 @@ class TranslatorApp(QWidget):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select SRT File",
-            "",
+            self._last_srt_dir,
             "SRT Files (*.srt);;All Files (*)"
         )
 
         if file_path:
+            self._last_srt_dir = os.path.dirname(file_path)
             self.log_area.append(f"[Argos] Selected: {os.path.basename(file_path)}")
             self.disable_ui()
             self.thread = ArgosTranslateThread(file_path)
@@ -1344,11 +1964,12 @@ class TranslatorApp(QWidget):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select SRT File",
-            "",
+            self._last_srt_dir,
             "SRT Files (*.srt);;All Files (*)"
         )
 
         if file_path:
+            self._last_srt_dir = os.path.dirname(file_path)
             api_key = self.api_key_input.text().strip()
             if not api_key:
                 self.log_area.append("[ChatGPT] ✗ Error: API key not provided")
@@ -1386,18 +2007,27 @@ class TranslatorApp(QWidget):
         self.api_key_input.setEnabled(True)
 
     def update_status(self, status: str):
-        """Update status label."""
-        self.status_label.setText(f"Status: {status}")
-        self.log_area.append(f"➜ {status}")
+        """Update status label. status may hold several batched lines."""
+        lines = status.split("\n")
+        self.status_label.setText(f"Status: {lines[-1]}")
+        self.log_area.append("\n".join(f"➜ {line}" for line in lines))
 
     def update_progress(self, value: int):
         """Update progress bar."""
         self.progress.setValue(value)
 
-    def on_translation_finished(self, message: str):
-        """Handle translation completion."""
+    def on_translation_finished(self, message: str, cues: Optional[List[Dict[str, str]]] = None):
+        """Handle translation completion, verifying the translated cues when the thread passes them."""
         self.status_label.setText(message)
         self.log_area.append(f"\n{message}\n")
+        if cues:
+            # The thread hands over its final cues, so the saved file is not parsed again
+            result = TranslationVerifier.verify_cues(cues)
+            self.log_area.append(
+                f"[Verify] {result['status']}: {result['translated']}/{result['total']} subtitles have text"
+            )
+            for issue in result['issues']:
+                self.log_area.append(f"[Verify]   - {issue}")
         self.progress.setValue(100)
         self.enable_ui()
 
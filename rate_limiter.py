@@ -0,0 +1,217 @@
+"""
+Rate limiting for concurrent OpenAI API requests.
+Paces requests against requests-per-minute (RPM) and tokens-per-minute (TPM)
+budgets and retries rate-limited (HTTP 429) and transient (timeout, connection,
+5xx) failures.
+"""
+
+import asyncio
+import random
+import re
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, List, Optional
+
+try:
+    from openai import APIConnectionError  # APITimeoutError is a subclass
+except ImportError:
+    APIConnectionError = ()  # isinstance(x, ()) is always False
+
+
+class RequestCancelled(Exception):
+    """Raised when should_stop() turns true while a request waits in the limiter."""
+
+
+class RateLimiter:
+    """
+    Async limiter that tracks RPM and TPM over a rolling one-minute window.
+    Requests wait in acquire() until both budgets have room for them.
+    """
+
+    WINDOW = 60.0           # Rolling window length in seconds
+    MAX_BACKOFF = 60.0      # Upper bound for any retry delay in seconds, header-supplied or not
+    STOP_POLL = 0.5         # How often waits check should_stop, in seconds
+
+    _DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+    _DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+    def __init__(self, rpm: int = 500, tpm: int = 200000, max_retries: int = 5):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rpm: Maximum requests per minute
+            tpm: Maximum tokens per minute
+            max_retries: Retries for a rate-limited request before giving up
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_retries = max_retries
+        self._requests: Deque[float] = deque()
+        self._tokens: Deque[List] = deque()  # [timestamp, tokens] reservations, corrected in place
+        self._token_total = 0
+        self._blocked_until = 0.0
+        self._condition = asyncio.Condition()
+
+    def _prune(self, now: float):
+        """Drop entries that have left the rolling window."""
+        cutoff = now - self.WINDOW
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._token_total -= self._tokens.popleft()[1]
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        """Seconds to wait before a request of the given size fits, 0 if it fits now."""
+        wait = self._blocked_until - now
+        if len(self._requests) >= self.rpm:
+            wait = max(wait, self._requests[0] + self.WINDOW - now)
+        # A single request larger than the whole budget only waits for an empty window
+        if self._tokens and self._token_total + tokens > self.tpm:
+            wait = max(wait, self._tokens[0][0] + self.WINDOW - now)
+        return wait
+
+    async def acquire(self, estimated_tokens: int, should_stop: Optional[Callable[[], bool]] = None) -> List:
+        """
+        Wait until a request using estimated_tokens fits in both budgets, then reserve it.
+        Returns the reservation to pass to record_usage().
+        Raises RequestCancelled if should_stop() turns true while waiting.
+        """
+        async with self._condition:
+            while True:
+                if should_stop is not None and should_stop():
+                    raise RequestCancelled()
+                now = time.monotonic()
+                self._prune(now)
+                wait = self._wait_time(now, estimated_tokens)
+                if wait <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout=min(wait, self.STOP_POLL))
+                except asyncio.TimeoutError:
+                    pass
+
+            reservation = [now, estimated_tokens]
+            self._requests.append(now)
+            self._tokens.append(reservation)
+            self._token_total += estimated_tokens
+            return reservation
+
+    async def record_usage(self, reservation: List, actual_tokens: int):
+        """
+        Replace a reservation's estimate with the usage reported by the API.
+        A reservation that has already left the window no longer counts, so it is left alone.
+        """
+        async with self._condition:
+            self._prune(time.monotonic())
+            if not self._tokens or reservation[0] < self._tokens[0][0]:
+                return
+            delta = actual_tokens - reservation[1]
+            reservation[1] = actual_tokens
+            self._token_total += delta
+            if delta < 0:
+                self._condition.notify_all()
+
+    def retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a failed request, at most MAX_BACKOFF.
+        Honors retry-after style response headers, else uses exponential backoff with jitter.
+        """
+        return min(self.MAX_BACKOFF, self._suggested_delay(error, attempt))
+
+    def _suggested_delay(self, error: Exception, attempt: int) -> float:
+        """Retry delay from the response headers, or exponential backoff with jitter."""
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms:
+            try:
+                return float(retry_after_ms) / 1000.0
+            except ValueError:
+                pass
+
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+        reset = headers.get("x-ratelimit-reset-tokens") or headers.get("x-ratelimit-reset-requests")
+        if reset:
+            seconds = self.parse_duration(reset)
+            if seconds is not None:
+                return seconds
+
+        return 2 ** attempt + random.uniform(0, 1)
+
+    @classmethod
+    def parse_duration(cls, value: str) -> Optional[float]:
+        """Parse OpenAI reset durations such as '20ms', '1.5s' or '6m0s' into seconds."""
+        parts = cls._DURATION_RE.findall(value)
+        if not parts:
+            return None
+        return sum(float(amount) * cls._DURATION_UNITS[unit] for amount, unit in parts)
+
+    @staticmethod
+    def is_rate_limit_error(error: Exception) -> bool:
+        """Check whether an API error is an HTTP 429 rate-limit response."""
+        return getattr(error, "status_code", None) == 429
+
+    @staticmethod
+    def is_transient_error(error: Exception) -> bool:
+        """Check whether an API error is worth retrying: timeouts, dropped connections, 408/409 and 5xx."""
+        if isinstance(error, APIConnectionError):
+            return True
+        status = getattr(error, "status_code", None)
+        return status is not None and (status in (408, 409) or status >= 500)
+
+    @staticmethod
+    async def _sleep(delay: float, should_stop: Optional[Callable[[], bool]]):
+        """Sleep for delay seconds, raising RequestCancelled as soon as should_stop() is true."""
+        deadline = time.monotonic() + delay
+        while True:
+            if should_stop is not None and should_stop():
+                raise RequestCancelled()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, RateLimiter.STOP_POLL))
+
+    async def call(self, request: Callable[[], Awaitable[Any]], estimated_tokens: int,
+                   should_stop: Optional[Callable[[], bool]] = None) -> Any:
+        """
+        Run request() within the rate limits, retrying on HTTP 429 and transient errors.
+
+        Args:
+            request: Zero-argument coroutine function performing the API call
+            estimated_tokens: Prompt tokens plus max_tokens for the request
+            should_stop: Optional check polled while waiting; when it returns True
+                         the wait ends with RequestCancelled
+
+        Returns:
+            The API response
+        """
+        attempt = 0
+        while True:
+            reservation = await self.acquire(estimated_tokens, should_stop)
+            try:
+                response = await request()
+            except Exception as e:
+                rate_limited = self.is_rate_limit_error(e)
+                if not (rate_limited or self.is_transient_error(e)) or attempt >= self.max_retries:
+                    raise
+                delay = self.retry_delay(e, attempt)
+                attempt += 1
+                if rate_limited:
+                    # Hold back every request, not just this one, until the limit resets
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+                await self._sleep(delay, should_stop)
+                continue
+
+            usage = getattr(response, "usage", None)
+            total_tokens = getattr(usage, "total_tokens", None)
+            if total_tokens is not None:
+                await self.record_usage(reservation, total_tokens)
+            return response
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Minimal runner shared by the script-style tests (no pytest required).
+"""
+
+from typing import Callable, Sequence
+
+
+def run_tests(title: str, tests: Sequence[Callable[[], None]]) -> bool:
+    """Run each test function, print PASS/FAIL per test and return True if all passed."""
+    print("=" * 70)
+    print(title)
+    print("=" * 70)
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print("PASS: {}".format(test.__name__))
+        except AssertionError as e:
+            failed += 1
+            print("FAIL: {} {}".format(test.__name__, e))
+    print("\n" + ("ALL TESTS PASSED!" if not failed else "{} TEST(S) FAILED!".format(failed)))
+    return failed == 0
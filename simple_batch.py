@@ -3,16 +3,52 @@ Simplified batch processing for sequential and parallel translation of multiple
 """
 
 import os
-import time
-from typing import Dict, List, Callable, Optional
-from PySide6.QtCore import QThread, Signal
+import threading
+from typing import List, Callable, Optional
+from PySide6.QtCore import QThread, QThreadPool, QRunnable, Signal
 
 from batch_processor import TranslationJob, TranslationStatus
 
 
+class _JobRunnable(QRunnable):
+    """Runs a single batch job on a QThreadPool worker thread."""
+
+    def __init__(self, processor: "SimpleBatchProcessor", job_index: int, job: TranslationJob):
+        super().__init__()
+        self.processor = processor
+        self.job_index = job_index
+        self.job = job
+
+    def run(self):
+        self.processor._execute_job(self.job_index, self.job)
+
+
+class _JobCallbacks:
+    """Progress/completion callbacks a job's executor reports through."""
+
+    __slots__ = ("processor", "job")
+
+    def __init__(self, processor: "SimpleBatchProcessor", job: TranslationJob):
+        self.processor = processor
+        self.job = job
+
+    def on_progress(self, progress: int, message: str = ""):
+        self.processor.job_progress.emit(self.job.job_id, progress, message)
+
+    def on_completed(self, output_path: Optional[str] = None):
+        self.job.status = TranslationStatus.COMPLETED
+        self.processor.job_completed.emit(self.job.job_id, output_path or "")
+
+    def on_failed(self, error: str):
+        self.job.status = TranslationStatus.FAILED
+        self.processor.job_failed.emit(self.job.job_id, error)
+        self.job.config['error_emitted'] = True
+
+
 class SimpleBatchProcessor(QThread):
     """
-    Simplified batch processor that handles multiple jobs sequentially.
+    Simplified batch processor that dispatches jobs to a thread pool,
+    running up to max_parallel jobs at once.
     Emits signals for UI updates.
     """
     
@@ -24,95 +60,120 @@ class SimpleBatchProcessor(QThread):
     batch_finished = Signal(dict)       # final stats
     
     def __init__(self, jobs: List[TranslationJob], 
-                 executor: Callable[[TranslationJob], bool]):
+                 executor: Callable[[TranslationJob], bool],
+                 max_parallel: int = 1, sort_by_size: bool = True):
         super().__init__()
-        self.jobs = jobs
+        # Largest files first so the longest jobs do not start last and leave a long tail
+        self.jobs = sorted(jobs, key=self._file_size, reverse=True) if sort_by_size else jobs
         self.executor = executor
         self.is_running = False
+        self.stop_event = threading.Event()
+        # Never start more pool threads than there are jobs to run
+        self.max_parallel = max(1, min(max_parallel, len(jobs)))
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(self.max_parallel)
+        self._lock = threading.Lock()
+        # Running totals, updated in place as jobs finish
+        self._stats = {"total": len(jobs), "completed": 0, "failed": 0, "current": 0}
+    
+    @staticmethod
+    def _file_size(job: TranslationJob) -> int:
+        """Size of a job's input file in bytes, 0 if it cannot be read."""
+        try:
+            return os.path.getsize(job.file_path)
+        except OSError:
+            return 0
     
     def run(self):
-        """Process all jobs sequentially."""
+        """Run all jobs, through the thread pool when more than one may run at once."""
         self.is_running = True
-        completed = 0
-        failed = 0
+        self.stop_event.clear()
+        stats = self._stats
+        stats["total"] = len(self.jobs)
+        stats["completed"] = stats["failed"] = stats["current"] = 0
         
         try:
-            for job_index, job in enumerate(self.jobs):
-                if not self.is_running:
-                    break
-                
-                # Mark job as running
-                job.status = TranslationStatus.RUNNING
-                job.progress = 0
-                self.job_started.emit(job.job_id)
+            if self.max_parallel == 1:
+                # Sequential: run on this thread rather than handing each job to a pool thread
+                for job_index, job in enumerate(self.jobs):
+                    if self.stop_event.is_set():
+                        break
+                    self._execute_job(job_index, job)
+            else:
+                for job_index, job in enumerate(self.jobs):
+                    if self.stop_event.is_set():
+                        break
+                    self.pool.start(_JobRunnable(self, job_index, job))
                 
-                # Create callbacks for this job (must capture job properly)
-                current_job = job  # Capture job in current scope to avoid closure issues
-                
-                def make_on_progress(current_job):
-                    def on_progress(progress: int, message: str = ""):
-                        self.job_progress.emit(current_job.job_id, progress, message)
-                    return on_progress
-                
-                def make_on_completed(current_job):
-                    def on_completed(output_path: Optional[str] = None):
-                        current_job.status = TranslationStatus.COMPLETED
-                        self.job_completed.emit(current_job.job_id, output_path or "")
-                    return on_completed
-                
-                def make_on_failed(current_job):
-                    def on_failed(error: str):
-                        current_job.status = TranslationStatus.FAILED
-                        self.job_failed.emit(current_job.job_id, error)
-                        current_job.config['error_emitted'] = True
-                    return on_failed
-                
-                # Store callbacks in job config
-                current_job.config['_on_progress'] = make_on_progress(current_job)
-                current_job.config['_on_completed'] = make_on_completed(current_job)
-                current_job.config['_on_failed'] = make_on_failed(current_job)
-                
-                try:
-                    # Execute the translation
-                    success = self.executor(current_job)
-                    
-                    if success:
-                        if current_job.status != TranslationStatus.COMPLETED:  # Callback may have set this
-                            current_job.status = TranslationStatus.COMPLETED
-                        completed += 1
-                    else:
-                        current_job.status = TranslationStatus.FAILED
-                        failed += 1
-                        # Only emit if callback didn't already
-                        if 'error_emitted' not in current_job.config or not current_job.config['error_emitted']:
-                            self.job_failed.emit(current_job.job_id, "Translation failed")
-                        
-                except Exception as e:
-                    current_job.status = TranslationStatus.FAILED
-                    failed += 1
-                    self.job_failed.emit(current_job.job_id, str(e))
-                
-                # Emit progress
-                stats = {
-                    "total": len(self.jobs),
-                    "completed": completed,
-                    "failed": failed,
-                    "current": job_index + 1
-                }
-                self.batch_progress.emit(stats)
+                self.pool.waitForDone()
         
         finally:
             self.is_running = False
             final_stats = {
-                "total": len(self.jobs),
-                "completed": completed,
-                "failed": failed
+                "total": stats["total"],
+                "completed": stats["completed"],
+                "failed": stats["failed"]
             }
             self.batch_finished.emit(final_stats)
     
-    def stop(self):
-        """Stop processing."""
+    def _execute_job(self, job_index: int, job: TranslationJob):
+        """Run a single job on the current pool thread."""
+        if self.stop_event.is_set():
+            return
+        
+        # Mark job as running
+        job.status = TranslationStatus.RUNNING
+        job.progress = 0
+        job.message = ""
+        self.job_started.emit(job.job_id)
+        
+        # Store callbacks in job config
+        current_job = job
+        callbacks = _JobCallbacks(self, current_job)
+        current_job.config['_on_progress'] = callbacks.on_progress
+        current_job.config['_on_completed'] = callbacks.on_completed
+        current_job.config['_on_failed'] = callbacks.on_failed
+        current_job.config['_should_stop'] = self.stop_event.is_set
+        
+        success = False
+        try:
+            # Execute the translation
+            success = self.executor(current_job)
+            
+            if success:
+                if current_job.status != TranslationStatus.COMPLETED:  # Callback may have set this
+                    current_job.status = TranslationStatus.COMPLETED
+            else:
+                current_job.status = TranslationStatus.FAILED
+                # Only emit if callback didn't already
+                if 'error_emitted' not in current_job.config or not current_job.config['error_emitted']:
+                    self.job_failed.emit(current_job.job_id, "Translation failed")
+                
+        except Exception as e:
+            current_job.status = TranslationStatus.FAILED
+            self.job_failed.emit(current_job.job_id, str(e))
+        
+        # Emit progress
+        with self._lock:
+            stats = self._stats
+            if success:
+                stats["completed"] += 1
+            else:
+                stats["failed"] += 1
+            stats["current"] += 1
+            # Copy: the signal may be delivered after later jobs update the counters
+            self.batch_progress.emit(stats.copy())
+    
+    def stop(self, wait: bool = True):
+        """
+        Stop processing: drop queued jobs and signal running ones to stop.
+        
+        Args:
+            wait: Block up to 5 seconds for the processor to finish. Pass False
+                  from the GUI thread and wait for batch_finished instead.
+        """
         self.is_running = False
-        self.wait(timeout=5000)
-
-
+        self.stop_event.set()
+        self.pool.clear()
+        if wait:
+            self.wait(5000)
@@ -0,0 +1,128 @@
+"""
+Token counting and subtitle batching for ChatGPT translation requests.
+Packs subtitles into numbered JSON batches sized to the token budget and
+unpacks the replies.
+"""
+
+import json
+from typing import Dict, List, Optional
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+class TokenCounter:
+    """Estimate OpenAI token counts and costs, using tiktoken when it is installed."""
+
+    MESSAGE_OVERHEAD = 20  # Role markers and reply priming added around chat messages
+
+    # Approximate USD prices per 1M tokens: (input, output)
+    PRICING = {
+        "gpt-4o-mini": (0.15, 0.60),
+        "gpt-4o": (2.50, 10.00),
+        "gpt-4-turbo": (10.00, 30.00),
+        "gpt-4": (30.00, 60.00),
+        "gpt-3.5-turbo": (0.50, 1.50),
+    }
+
+    _encodings: Dict[str, object] = {}
+
+    @staticmethod
+    def count(text: str, model: str) -> int:
+        """Count (or estimate) the number of tokens in text for the given model."""
+        if not TIKTOKEN_AVAILABLE:
+            # Rough fallback: ~4 characters per token for English text
+            return len(text) // 4 + 1
+
+        encoding = TokenCounter._encodings.get(model)
+        if encoding is None:
+            try:
+                encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                encoding = tiktoken.get_encoding("cl100k_base")
+            TokenCounter._encodings[model] = encoding
+        return len(encoding.encode(text))
+
+    @staticmethod
+    def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+        """Estimate the USD cost of a token usage, or None for unknown models."""
+        pricing = TokenCounter.PRICING.get(model)
+        if pricing is None:
+            return None
+        return (prompt_tokens * pricing[0] + completion_tokens * pricing[1]) / 1_000_000
+
+
+class SubtitleBatcher:
+    """Pack several subtitles into one ChatGPT request and unpack the numbered JSON reply."""
+
+    BATCH_SIZE = 30          # Maximum subtitles per request
+    MAX_TOKENS = 4000        # max_tokens sent with each batch request
+    SAFETY = 0.75            # Fraction of MAX_TOKENS the estimated output may use
+    OUTPUT_RATIO = 3         # Arabic output usually needs more tokens than the English input
+    ITEM_OVERHEAD = 8        # JSON key, quotes and separators per item
+    JSON_MODE_UNSUPPORTED = ("gpt-4",)
+
+    @staticmethod
+    def make_batches(subtitles: List[Dict[str, str]], model: str) -> List[List[Dict[str, str]]]:
+        """Group subtitles so each batch's estimated reply stays under the token budget."""
+        budget = SubtitleBatcher.MAX_TOKENS * SubtitleBatcher.SAFETY
+        batches = []
+        current = []
+        used = 0
+
+        for subtitle in subtitles:
+            cost = (TokenCounter.count(subtitle['text'], model) * SubtitleBatcher.OUTPUT_RATIO
+                    + SubtitleBatcher.ITEM_OVERHEAD)
+            if current and (len(current) >= SubtitleBatcher.BATCH_SIZE or used + cost > budget):
+                batches.append(current)
+                current = []
+                used = 0
+            current.append(subtitle)
+            used += cost
+
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def build_prompt(texts: List[str]) -> str:
+        """Build the user message for a batch of subtitle texts."""
+        numbered = {str(i): text for i, text in enumerate(texts, start=1)}
+        return (
+            "Translate the value of each numbered subtitle below to Arabic following the rules above. "
+            "Return a JSON object mapping each number to its translation, "
+            'e.g. {"1": "...", "2": "..."}. Keep the same numbers, keep line breaks, '
+            "and never merge or split subtitles.\n\n"
+            + json.dumps(numbered, ensure_ascii=False, indent=0)
+        )
+
+    @staticmethod
+    def parse_response(content: str, count: int) -> Optional[List[str]]:
+        """
+        Parse a numbered JSON reply.
+
+        Returns:
+            List of translations in batch order ("" where a number is missing),
+            or None if the reply is not a usable JSON object
+        """
+        try:
+            data = json.loads(content)
+        except (TypeError, ValueError):
+            return None
+
+        if not isinstance(data, dict):
+            return None
+
+        results = []
+        for i in range(1, count + 1):
+            value = data.get(str(i))
+            results.append(value.strip() if isinstance(value, str) else "")
+        return results
+
+    @staticmethod
+    def supports_json_mode(model: str) -> bool:
+        """Check whether the model accepts response_format={"type": "json_object"}."""
+        return model not in SubtitleBatcher.JSON_MODE_UNSUPPORTED
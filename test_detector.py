@@ -46,13 +46,18 @@ test_sentences_code = [
     "var name = 'test'"
 ]
 
-print("--- Testing CodeDetector (Relaxed) ---")
-print("\n[Natural Language Check - Should be False]")
-for sent in test_sentences_natural:
-    is_code = CodeDetector.is_code_or_technical(sent)
-    print(f"'{sent}' -> Is Code? {is_code}")
-
-print("\n[Code Check - Should be True]")
-for sent in test_sentences_code:
-    is_code = CodeDetector.is_code_or_technical(sent)
-    print(f"'{sent}' -> Is Code? {is_code}")
+def main():
+    print("--- Testing CodeDetector (Relaxed) ---")
+    print("\n[Natural Language Check - Should be False]")
+    for sent in test_sentences_natural:
+        is_code = CodeDetector.is_code_or_technical(sent)
+        print(f"'{sent}' -> Is Code? {is_code}")
+
+    print("\n[Code Check - Should be True]")
+    for sent in test_sentences_code:
+        is_code = CodeDetector.is_code_or_technical(sent)
+        print(f"'{sent}' -> Is Code? {is_code}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test script for the ChatGPT rate limiter: rolling-window pacing, retry headers,
+transient-error retries and stop handling.
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+# Add the workspace directory to path
+workspace_dir = Path(__file__).parent
+sys.path.insert(0, str(workspace_dir))
+
+from rate_limiter import RateLimiter, RequestCancelled
+from script_runner import run_tests
+
+
+class FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class FakeAPIError(Exception):
+    """Mimics an openai.APIStatusError: a status code plus the HTTP response."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__("HTTP {}".format(status_code))
+        self.status_code = status_code
+        self.response = FakeResponse(headers or {})
+
+
+def test_rpm_window():
+    """A request over the RPM budget waits for the oldest one to leave the window."""
+    limiter = RateLimiter(rpm=2, tpm=1000000)
+    limiter.WINDOW = 0.3
+
+    async def run():
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire(1)
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+    assert 0.25 <= elapsed < 1.0, elapsed
+
+
+def test_tpm_window_and_usage_correction():
+    """Token budget is enforced, and reported usage below the estimate frees budget."""
+    limiter = RateLimiter(rpm=1000, tpm=100)
+    limiter.WINDOW = 0.3
+
+    async def run():
+        reservation = await limiter.acquire(80)
+        await limiter.record_usage(reservation, 10)  # The request really used 10 tokens
+        start = time.monotonic()
+        await limiter.acquire(80)  # Fits now: 10 + 80 <= 100
+        fast = time.monotonic() - start
+        start = time.monotonic()
+        await limiter.acquire(80)  # Over budget until the window rolls
+        return fast, time.monotonic() - start
+
+    fast, slow = asyncio.run(run())
+    assert fast < 0.1, fast
+    assert slow >= 0.25, slow
+
+
+def test_usage_after_reservation_expired():
+    """A correction arriving after its reservation left the window must not free extra budget."""
+    limiter = RateLimiter(rpm=1000, tpm=100)
+    limiter.WINDOW = 0.3
+
+    async def run():
+        reservation = await limiter.acquire(80)
+        await asyncio.sleep(0.35)  # The slow response outlives the reservation
+        await limiter.record_usage(reservation, 10)
+        assert limiter._token_total == 0, limiter._token_total
+        await limiter.acquire(80)
+        start = time.monotonic()
+        await limiter.acquire(80)  # Must wait: 80 + 80 > 100
+        return time.monotonic() - start
+
+    slow = asyncio.run(run())
+    assert slow >= 0.25, slow
+
+
+def test_parse_duration():
+    assert RateLimiter.parse_duration("20ms") == 0.02
+    assert RateLimiter.parse_duration("1.5s") == 1.5
+    assert RateLimiter.parse_duration("6m0s") == 360.0
+    assert RateLimiter.parse_duration("soon") is None
+
+
+def test_retry_delay_headers_and_cap():
+    limiter = RateLimiter()
+    assert limiter.retry_delay(FakeAPIError(429, {"retry-after-ms": "250"}), 0) == 0.25
+    assert limiter.retry_delay(FakeAPIError(429, {"retry-after": "3"}), 0) == 3.0
+    assert limiter.retry_delay(FakeAPIError(429, {"x-ratelimit-reset-tokens": "1.5s"}), 0) == 1.5
+    # Header values are clamped so one response cannot stall every request for minutes
+    assert limiter.retry_delay(FakeAPIError(429, {"x-ratelimit-reset-requests": "6m0s"}), 0) == RateLimiter.MAX_BACKOFF
+    # No header: exponential backoff with up to a second of jitter, also clamped
+    assert 4.0 <= limiter.retry_delay(FakeAPIError(500), 2) < 5.0
+    assert limiter.retry_delay(FakeAPIError(500), 20) == RateLimiter.MAX_BACKOFF
+
+
+def test_retryable_errors():
+    assert RateLimiter.is_rate_limit_error(FakeAPIError(429))
+    assert RateLimiter.is_transient_error(FakeAPIError(503))
+    assert RateLimiter.is_transient_error(FakeAPIError(408))
+    assert not RateLimiter.is_transient_error(FakeAPIError(400))
+    assert not RateLimiter.is_transient_error(ValueError("bad"))
+
+
+def test_call_retries_transient_errors():
+    limiter = RateLimiter(max_retries=3)
+    limiter.retry_delay = lambda error, attempt: 0.01
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise FakeAPIError(502)
+        return "ok"
+
+    assert asyncio.run(limiter.call(flaky, 10)) == "ok"
+    assert len(attempts) == 3
+
+
+def test_call_raises_client_errors():
+    limiter = RateLimiter(max_retries=3)
+    attempts = []
+
+    async def bad_request():
+        attempts.append(1)
+        raise FakeAPIError(400)
+
+    try:
+        asyncio.run(limiter.call(bad_request, 10))
+    except FakeAPIError:
+        pass
+    else:
+        raise AssertionError("400 should not be retried")
+    assert len(attempts) == 1
+
+
+def test_call_stops_during_retry_wait():
+    limiter = RateLimiter()
+    limiter.retry_delay = lambda error, attempt: 30.0
+    stopped = []
+
+    async def rate_limited():
+        asyncio.get_running_loop().call_later(0.2, stopped.append, True)
+        raise FakeAPIError(429)
+
+    start = time.monotonic()
+    try:
+        asyncio.run(limiter.call(rate_limited, 10, lambda: bool(stopped)))
+    except RequestCancelled:
+        pass
+    else:
+        raise AssertionError("Stop should cancel the retry wait")
+    assert time.monotonic() - start < 2.0
+
+
+TESTS = [
+    test_rpm_window,
+    test_tpm_window_and_usage_correction,
+    test_usage_after_reservation_expired,
+    test_parse_duration,
+    test_retry_delay_headers_and_cap,
+    test_retryable_errors,
+    test_call_retries_transient_errors,
+    test_call_raises_client_errors,
+    test_call_stops_during_retry_wait,
+]
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run_tests("RATE LIMITER TEST", TESTS) else 1)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test script for ChatGPT subtitle batching: numbered-JSON prompts, reply parsing
+and token-budgeted batch splitting.
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Add the workspace directory to path
+workspace_dir = Path(__file__).parent
+sys.path.insert(0, str(workspace_dir))
+
+# Import only Qt-free modules, NOT main.py
+from subtitle_batcher import SubtitleBatcher
+from script_runner import run_tests
+
+def test_batch_prompt_round_trip():
+    texts = ["Hello", "Two\nlines", 'Quote "here"']
+    prompt = SubtitleBatcher.build_prompt(texts)
+    payload = json.loads(prompt[prompt.index("\n\n") + 2:])
+    assert payload == {"1": "Hello", "2": "Two\nlines", "3": 'Quote "here"'}
+
+    reply = json.dumps({"1": " مرحبا ", "3": "اقتباس"}, ensure_ascii=False)
+    assert SubtitleBatcher.parse_response(reply, 3) == ["مرحبا", "", "اقتباس"]
+
+
+def test_parse_response_rejects_unusable_replies():
+    assert SubtitleBatcher.parse_response("not json", 2) is None
+    assert SubtitleBatcher.parse_response('["a", "b"]', 2) is None
+    assert SubtitleBatcher.parse_response(None, 2) is None
+    # Non-string values count as missing
+    assert SubtitleBatcher.parse_response('{"1": 5, "2": "b"}', 2) == ["", "b"]
+
+
+def test_make_batches_limits():
+    subtitles = [{'text': "short line"} for _ in range(SubtitleBatcher.BATCH_SIZE * 2 + 5)]
+    batches = SubtitleBatcher.make_batches(subtitles, "gpt-4o-mini")
+    assert [len(b) for b in batches] == [SubtitleBatcher.BATCH_SIZE, SubtitleBatcher.BATCH_SIZE, 5]
+    assert [s for b in batches for s in b] == subtitles  # Order preserved
+
+    # Long lines are split by the token budget before BATCH_SIZE is reached
+    long_subtitles = [{'text': "word " * 300} for _ in range(10)]
+    long_batches = SubtitleBatcher.make_batches(long_subtitles, "gpt-4o-mini")
+    assert len(long_batches) > 1
+    assert sum(len(b) for b in long_batches) == 10
+
+    assert SubtitleBatcher.make_batches([], "gpt-4o-mini") == []
+
+
+TESTS = [
+    test_batch_prompt_round_trip,
+    test_parse_response_rejects_unusable_replies,
+    test_make_batches_limits,
+]
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run_tests("SUBTITLE BATCHING TEST", TESTS) else 1)
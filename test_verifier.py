@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for SRT cue parsing and verification in translation_verifier.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the workspace directory to path
+workspace_dir = Path(__file__).parent
+sys.path.insert(0, str(workspace_dir))
+
+# Import only Qt-free modules, NOT main.py
+from translation_verifier import TranslationVerifier, parse_cues
+from script_runner import run_tests
+
+
+def parse_bytes(data: bytes):
+    """Write data to a temporary .srt file and parse it with the verifier."""
+    fd, path = tempfile.mkstemp(suffix=".srt")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return TranslationVerifier.parse_srt(path), TranslationVerifier.verify_file(path)
+    finally:
+        os.remove(path)
+
+
+def test_parse_basic_and_multiline():
+    cues, result = parse_bytes(
+        "1\n00:00:01,000 --> 00:00:02,000\nHello\nworld\n\n"
+        "2\n00:00:02,000 --> 00:00:03,000\nمرحبا\n".encode("utf-8")
+    )
+    assert [c['index'] for c in cues] == ['1', '2']
+    assert cues[0]['timestamp'] == "00:00:01,000 --> 00:00:02,000"
+    assert cues[0]['text'] == "Hello\nworld"
+    assert cues[1]['text'] == "مرحبا"
+    assert result['status'] == "PASS"
+
+
+def test_empty_cue_does_not_swallow_next():
+    cues, result = parse_bytes(
+        b"1\n00:00:01,000 --> 00:00:02,000\n\n"
+        b"2\n00:00:02,000 --> 00:00:03,000\nSecond\n"
+    )
+    assert [c['text'] for c in cues] == ["", "Second"]
+    assert result['empty'] == 1 and result['status'] == "PARTIAL"
+
+
+def test_whitespace_only_cue_is_empty():
+    cues, result = parse_bytes(b"1\n00:00:01,000 --> 00:00:02,000\n   \n")
+    assert cues[0]['text'] == ""
+    assert result['status'] == "FAIL"
+
+
+def test_unicode_whitespace_cue_is_empty():
+    """A cue holding only non-ASCII whitespace is empty on both verification paths."""
+    data = ("1\n00:00:01,000 --> 00:00:02,000\nA\n\n"
+            "2\n00:00:02,000 --> 00:00:03,000\n\u00a0\u3000\n").encode("utf-8")
+    cues, from_file = parse_bytes(data)
+    from_memory = TranslationVerifier.verify_cues(cues)
+    assert from_file['status'] == from_memory['status'] == "PARTIAL", (from_file, from_memory)
+    assert from_file['empty'] == from_memory['empty'] == 1
+
+
+def test_crlf_and_bom():
+    cues, result = parse_bytes(
+        b"\xef\xbb\xbf1\r\n00:00:01,000 --> 00:00:02,000\r\nLine one\r\nLine two\r\n\r\n"
+        b"2\r\n00:00:02,000 --> 00:00:03,000\r\nLast\r\n"
+    )
+    assert [c['index'] for c in cues] == ['1', '2']
+    assert cues[0]['text'] == "Line one\nLine two"
+    assert result['total'] == 2
+
+
+def test_invalid_utf8_is_replaced():
+    """An invalid byte only affects its own cue; the file still parses."""
+    cues = parse_cues(b"1\n00:00:01,000 --> 00:00:02,000\nbad \xff byte\n\n"
+                      b"2\n00:00:02,000 --> 00:00:03,000\nfine\n")
+    assert [c['text'] for c in cues] == ["bad \ufffd byte", "fine"]
+
+
+def test_verify_cues_matches_verify_file():
+    data = (b"1\n00:00:01,000 --> 00:00:02,000\nA\n\n"
+            b"2\n00:00:02,000 --> 00:00:03,000\n\n")
+    cues, from_file = parse_bytes(data)
+    from_memory = TranslationVerifier.verify_cues(cues)
+    for key in ("status", "total", "empty", "translated", "issues"):
+        assert from_file[key] == from_memory[key], key
+
+
+TESTS = [
+    test_parse_basic_and_multiline,
+    test_empty_cue_does_not_swallow_next,
+    test_whitespace_only_cue_is_empty,
+    test_unicode_whitespace_cue_is_empty,
+    test_crlf_and_bom,
+    test_invalid_utf8_is_replaced,
+    test_verify_cues_matches_verify_file,
+]
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run_tests("SRT VERIFIER TEST", TESTS) else 1)
@@ -3,35 +3,97 @@ Translation Verification Utility
 Validates that all subtitles have been properly translated and no sentences are left untranslated.
 """
 
+import io
 import os
-import json
-from pathlib import Path
-from typing import Dict, List, Tuple
+import math
+import re
+import sys
+import mmap
+import stat
+import fnmatch
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+# index line, timing line, then the text as a run of non-empty lines (possibly none,
+# so empty cues are still reported). Matched on raw bytes; fields are decoded only when needed.
+SRT_CUE_RE = re.compile(
+    rb'(?:^|(?<=\xef\xbb\xbf))(\d+)[ \t]*\r?\n([^\r\n]*-->[^\r\n]*)(?:\r?\n|\Z)'
+    rb'((?:[^\r\n]+(?:\r?\n|\Z))*)',
+    re.MULTILINE
+)
+
+
+def parse_cues(content: bytes) -> List[Dict[str, str]]:
+    """
+    Build subtitle dicts from raw SRT bytes (bytes or an mmap).
+    Decode policy: UTF-8 with errors='replace', so a stray invalid byte becomes
+    U+FFFD in its own cue instead of failing the whole file.
+    Also used by SRTParser in main.py, so both parsers agree on what a cue is.
+    """
+    return [
+        {
+            'index': match.group(1).decode('ascii'),  # \d+ on bytes only matches ASCII digits
+            'timestamp': match.group(2).strip().decode('utf-8', errors='replace'),
+            'text': match.group(3).decode('utf-8', errors='replace').replace('\r\n', '\n').strip()
+        }
+        for match in SRT_CUE_RE.finditer(content)
+    ]
+
+
+# Files smaller than this are read directly; mapping them costs more than it saves
+_MMAP_THRESHOLD = 64 * 1024
 
 
 class TranslationVerifier:
     """Verify translation completeness and quality."""
 
+    MAX_REPORTED_INDICES = 50  # Empty subtitle indices listed per file in the report
+    _STATUS_SLOTS = {"PASS": 0, "FAIL": 1, "PARTIAL": 2}  # Status -> tally index in verify_directory
+    _FILES_PER_WORKER = 8  # verify_directory chunk size; fewer files than two chunks are verified in-process
+
+    @staticmethod
+    @contextmanager
+    def _open_srt(file_path: str, size: Optional[int] = None) -> Iterator[bytes]:
+        """Yield the raw bytes of an SRT file, memory-mapping large files."""
+        with open(file_path, 'rb') as f:
+            if size is None:
+                size = os.fstat(f.fileno()).st_size
+            if size < _MMAP_THRESHOLD:
+                yield f.read()
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    yield mm
+
+    @staticmethod
+    def _is_blank(text: bytes) -> bool:
+        """
+        Whether raw cue text is empty or only whitespace, by the same rule as the decoded text.
+        ASCII text is checked as bytes; anything else is decoded first so that
+        Unicode whitespace such as U+00A0 also counts as empty.
+        """
+        if not text or text.isspace():
+            return True
+        return not text.isascii() and text.decode('utf-8', errors='replace').isspace()
+
+    @staticmethod
+    def _iter_srt(file_path: str, size: Optional[int] = None) -> Iterator[bool]:
+        """Yield, for each subtitle in order, whether its text is empty."""
+        try:
+            with TranslationVerifier._open_srt(file_path, size) as content:
+                for match in SRT_CUE_RE.finditer(content):
+                    yield TranslationVerifier._is_blank(match.group(3))
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+
     @staticmethod
     def parse_srt(file_path: str) -> List[Dict[str, str]]:
         """Parse SRT file into subtitle blocks."""
         subtitles = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            blocks = content.strip().split('\n\n')
-            for block in blocks:
-                lines = block.strip().split('\n')
-                if len(lines) >= 3:
-                    try:
-                        subtitles.append({
-                            'index': lines[0].strip(),
-                            'timestamp': lines[1].strip(),
-                            'text': '\n'.join(lines[2:]).strip()
-                        })
-                    except Exception:
-                        pass
+            with TranslationVerifier._open_srt(file_path) as content:
+                subtitles = parse_cues(content)
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
         
@@ -45,12 +107,47 @@ class TranslationVerifier:
         Returns:
             Dictionary with verification results
         """
-        if not os.path.exists(file_path):
+        try:
+            st = os.stat(file_path)
+        except OSError:
             return {"error": f"File not found: {file_path}"}
+        if not stat.S_ISREG(st.st_mode):
+            return {"error": f"Not a regular file: {file_path}"}
         
-        subtitles = TranslationVerifier.parse_srt(file_path)
+        # Count straight off the regex matches instead of building every subtitle dict
+        return TranslationVerifier._summarize(file_path, TranslationVerifier._iter_srt(file_path, st.st_size))
+
+    @staticmethod
+    def verify_cues(cues: List[Dict[str, str]], file_path: str = "<in memory>") -> Dict:
+        """
+        Verify subtitles that are already parsed, e.g. handed over by a
+        translation thread, without reading the file back.
         
-        if not subtitles:
+        Returns:
+            Dictionary with verification results
+        """
+        return TranslationVerifier._summarize(
+            file_path,
+            (not cue['text'] or cue['text'].isspace() for cue in cues)
+        )
+
+    @staticmethod
+    def _summarize(file_path: str, empty_flags: Iterable[bool]) -> Dict:
+        """Build the verification result from one emptiness flag per subtitle."""
+        empty_count = 0
+        translated_count = 0
+        empty_indices = []
+        
+        for i, is_empty in enumerate(empty_flags):
+            if is_empty:
+                empty_count += 1
+                if len(empty_indices) < TranslationVerifier.MAX_REPORTED_INDICES:
+                    empty_indices.append(i + 1)
+            else:
+                translated_count += 1
+        
+        total = empty_count + translated_count
+        if total == 0:
             return {
                 "file": file_path,
                 "status": "ERROR",
@@ -60,28 +157,18 @@ class TranslationVerifier:
                 "issues": ["No subtitles found in file"]
             }
         
-        empty_count = 0
-        translated_count = 0
-        empty_indices = []
-        
-        for i, subtitle in enumerate(subtitles):
-            text = subtitle['text'].strip()
-            
-            if not text:
-                empty_count += 1
-                empty_indices.append(i + 1)
-            else:
-                translated_count += 1
-        
         issues = []
         if empty_count > 0:
-            issues.append(f"Found {empty_count} EMPTY subtitles at indices: {empty_indices}")
+            indices = str(empty_indices)
+            if empty_count > len(empty_indices):
+                indices += f" (+{empty_count - len(empty_indices)} more)"
+            issues.append(f"Found {empty_count} EMPTY subtitles at indices: {indices}")
         
         if translated_count == 0:
             issues.append("NO TRANSLATIONS FOUND - All subtitles are empty!")
             status = "FAIL"
         elif empty_count > 0:
-            issues.append(f"WARNING: {empty_count}/{len(subtitles)} subtitles are untranslated")
+            issues.append(f"WARNING: {empty_count}/{total} subtitles are untranslated")
             status = "PARTIAL"
         else:
             status = "PASS"
@@ -89,10 +176,10 @@ class TranslationVerifier:
         return {
             "file": file_path,
             "status": status,
-            "total": len(subtitles),
+            "total": total,
             "empty": empty_count,
             "translated": translated_count,
-            "percentage": round((translated_count / len(subtitles) * 100), 1) if subtitles else 0,
+            "percentage": round((translated_count / total * 100), 1),
             "issues": issues
         }
 
@@ -108,36 +195,42 @@ class TranslationVerifier:
         Returns:
             Summary of all verifications
         """
-        if not os.path.isdir(directory):
+        # Compile the pattern once; normcase keeps fnmatch's case rules per platform
+        matches = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+        try:
+            # scandir reports entry types from the directory listing, without a stat per file
+            with os.scandir(directory) as entries:
+                file_paths = [entry.path for entry in entries
+                              if matches(os.path.normcase(entry.name)) and entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
             return {"error": f"Directory not found: {directory}"}
+        except OSError as e:
+            return {"error": f"Cannot read directory {directory}: {e.strerror or e}"}
         
-        path = Path(directory)
-        files = list(path.glob(pattern))
-        
-        if not files:
+        if not file_paths:
             return {"error": f"No files matching pattern '{pattern}' found in {directory}"}
         
-        results = []
-        total_files = len(files)
-        passed_files = 0
-        failed_files = 0
-        partial_files = 0
-        total_subtitles = 0
-        total_empty = 0
-        
-        for file_path in sorted(files):
-            result = TranslationVerifier.verify_file(str(file_path))
-            results.append(result)
-            
-            if result.get("status") == "PASS":
-                passed_files += 1
-            elif result.get("status") == "FAIL":
-                failed_files += 1
-            elif result.get("status") == "PARTIAL":
-                partial_files += 1
-            
-            total_subtitles += result.get("total", 0)
-            total_empty += result.get("empty", 0)
+        total_files = len(file_paths)
+        file_paths.sort()
+        
+        # Parsing is CPU-bound, so spread files across processes, but start no more
+        # workers than there are chunks of files to hand out
+        workers = min(os.cpu_count() or 1, math.ceil(total_files / TranslationVerifier._FILES_PER_WORKER))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(TranslationVerifier.verify_file, file_paths,
+                                            chunksize=TranslationVerifier._FILES_PER_WORKER))
+        else:
+            results = [TranslationVerifier.verify_file(path) for path in file_paths]
+        
+        # passed, failed, partial, other (errors), subtitles, empty subtitles
+        tally = [0, 0, 0, 0, 0, 0]
+        status_slots = TranslationVerifier._STATUS_SLOTS
+        for result in results:
+            tally[status_slots.get(result.get("status"), 3)] += 1
+            tally[4] += result.get("total", 0)
+            tally[5] += result.get("empty", 0)
+        passed_files, failed_files, partial_files, _, total_subtitles, total_empty = tally
         
         return {
             "directory": directory,
@@ -157,60 +250,60 @@ class TranslationVerifier:
     @staticmethod
     def print_report(verification_result: Dict):
         """Print a human-readable verification report."""
+        # Build the whole report first and write it in one go
+        out = io.StringIO()
         if "error" in verification_result:
-            print(f"ERROR: {verification_result['error']}")
-            return
-        
-        if "directory" in verification_result:
+            print(f"ERROR: {verification_result['error']}", file=out)
+        elif "directory" in verification_result:
             # Directory verification report
             summary = verification_result['summary']
-            print(f"\n{'='*70}")
-            print(f"TRANSLATION VERIFICATION REPORT - {verification_result['directory']}")
-            print(f"{'='*70}")
-            print(f"\nPattern: {verification_result['pattern']}")
-            print(f"\nSummary:")
-            print(f"  Total Files: {summary['total_files']}")
-            print(f"  ✓ Passed (all translated): {summary['passed']}")
-            print(f"  ⚠ Partial (some untranslated): {summary['partial']}")
-            print(f"  ✗ Failed (all untranslated): {summary['failed']}")
-            print(f"\nSubtitle Statistics:")
-            print(f"  Total Subtitles: {summary['total_subtitles']}")
-            print(f"  Translated: {summary['total_subtitles'] - summary['untranslated_subtitles']}")
-            print(f"  Untranslated (EMPTY): {summary['untranslated_subtitles']}")
-            print(f"  Completion Rate: {summary['completion_percentage']}%")
+            print(f"\n{'='*70}", file=out)
+            print(f"TRANSLATION VERIFICATION REPORT - {verification_result['directory']}", file=out)
+            print(f"{'='*70}", file=out)
+            print(f"\nPattern: {verification_result['pattern']}", file=out)
+            print(f"\nSummary:", file=out)
+            print(f"  Total Files: {summary['total_files']}", file=out)
+            print(f"  ✓ Passed (all translated): {summary['passed']}", file=out)
+            print(f"  ⚠ Partial (some untranslated): {summary['partial']}", file=out)
+            print(f"  ✗ Failed (all untranslated): {summary['failed']}", file=out)
+            print(f"\nSubtitle Statistics:", file=out)
+            print(f"  Total Subtitles: {summary['total_subtitles']}", file=out)
+            print(f"  Translated: {summary['total_subtitles'] - summary['untranslated_subtitles']}", file=out)
+            print(f"  Untranslated (EMPTY): {summary['untranslated_subtitles']}", file=out)
+            print(f"  Completion Rate: {summary['completion_percentage']}%", file=out)
             
             if summary['failed'] > 0 or summary['partial'] > 0:
-                print(f"\n{'='*70}")
-                print("ISSUES FOUND:")
-                print(f"{'='*70}")
+                print(f"\n{'='*70}", file=out)
+                print("ISSUES FOUND:", file=out)
+                print(f"{'='*70}", file=out)
                 for file_result in verification_result['files']:
                     if file_result['status'] != 'PASS':
-                        print(f"\n{file_result['file']}:")
-                        print(f"  Status: {file_result['status']}")
-                        print(f"  Translated: {file_result['translated']}/{file_result['total']}")
+                        print(f"\n{file_result['file']}:", file=out)
+                        print(f"  Status: {file_result['status']}", file=out)
+                        print(f"  Translated: {file_result['translated']}/{file_result['total']}", file=out)
                         for issue in file_result.get('issues', []):
-                            print(f"  - {issue}")
+                            print(f"  - {issue}", file=out)
         else:
             # Single file verification report
-            print(f"\n{'='*70}")
-            print(f"TRANSLATION VERIFICATION - {verification_result['file']}")
-            print(f"{'='*70}")
-            print(f"Status: {verification_result['status']}")
-            print(f"Total Subtitles: {verification_result['total']}")
-            print(f"Translated: {verification_result['translated']}")
-            print(f"Empty/Untranslated: {verification_result['empty']}")
-            print(f"Completion: {verification_result.get('percentage', 0)}%")
+            print(f"\n{'='*70}", file=out)
+            print(f"TRANSLATION VERIFICATION - {verification_result['file']}", file=out)
+            print(f"{'='*70}", file=out)
+            print(f"Status: {verification_result['status']}", file=out)
+            print(f"Total Subtitles: {verification_result['total']}", file=out)
+            print(f"Translated: {verification_result['translated']}", file=out)
+            print(f"Empty/Untranslated: {verification_result['empty']}", file=out)
+            print(f"Completion: {verification_result.get('percentage', 0)}%", file=out)
             
             if verification_result['issues']:
-                print(f"\nIssues:")
+                print(f"\nIssues:", file=out)
                 for issue in verification_result['issues']:
-                    print(f"  - {issue}")
+                    print(f"  - {issue}", file=out)
+        
+        sys.stdout.write(out.getvalue())
 
 
 def main():
     """Main entry point for verification."""
-    import sys
-    
     if len(sys.argv) < 2:
         print("Translation Verifier - Check if all subtitles have been translated")
         print("\nUsage:")